@@ -0,0 +1,55 @@
+"""Benchmark deteksi anomali pada ledger sintetis.
+
+Jalankan dari root repo::
+
+    python benchmarks/bench_anomaly.py --rows 1000000
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import CATEGORIES, timed  # juga menambahkan root repo ke sys.path
+
+from financekita import anomaly
+
+
+def make_ledger(n_rows, n_days=3650, seed=0):
+    """Ledger pengeluaran sintetis, terurut per tanggal."""
+    rng = np.random.default_rng(seed)
+    days = np.sort(rng.integers(0, n_days, n_rows))
+    return pd.DataFrame({
+        "Tanggal": pd.Timestamp("2016-01-01") + pd.to_timedelta(days, unit="D"),
+        "Tipe": "Pengeluaran",
+        "Kategori": rng.choice(CATEGORIES, n_rows),
+        "Jumlah": rng.lognormal(11, 0.8, n_rows).round(-2),
+        "Catatan": "",
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--append", type=int, default=1_000, help="baris baru untuk update inkremental")
+    args = parser.parse_args()
+
+    df = make_ledger(args.rows + args.append)
+    df_old, df_new = df.iloc[:args.rows], df
+    df_daily = df.groupby([df["Tanggal"], "Tipe", "Kategori"])["Jumlah"].agg(Jumlah="sum").reset_index()
+    df_daily_old = df_daily[df_daily["Tanggal"] <= df_old["Tanggal"].max()]
+
+    print(f"rows={args.rows:,} append={args.append:,} daily_rows={len(df_daily):,}")
+    _, flagged_txn, states = timed(
+        "full build (transactions + daily)",
+        lambda: anomaly.update_anomalies(df_daily_old, df_old),
+    )
+    _, flagged_txn, _ = timed(
+        "incremental update (appended rows)",
+        lambda: anomaly.update_anomalies(df_daily, df_new, states),
+    )
+    print(f"flagged transactions: {len(flagged_txn):,}")
+
+
+if __name__ == "__main__":
+    main()
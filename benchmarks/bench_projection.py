@@ -0,0 +1,57 @@
+"""Benchmark proyeksi tabungan Monte Carlo pada ledger sintetis.
+
+Jalankan dari root repo::
+
+    python benchmarks/bench_projection.py --paths 10000
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import CATEGORIES, timed  # juga menambahkan root repo ke sys.path
+
+from financekita import projection
+
+
+def make_daily(n_days=3650, seed=0):
+    """Total harian sintetis: gaji bulanan dan pengeluaran harian per kategori."""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range(pd.Timestamp.today().normalize() - pd.Timedelta(days=n_days - 1), periods=n_days)
+    expense = pd.DataFrame({
+        "Tanggal": np.repeat(days, len(CATEGORIES)),
+        "Tipe": "Pengeluaran",
+        "Kategori": np.tile(CATEGORIES, n_days),
+        "Jumlah": rng.lognormal(11, 0.8, n_days * len(CATEGORIES)).round(-2),
+    })
+    paydays = days[days.day == 25]
+    income = pd.DataFrame({
+        "Tanggal": paydays,
+        "Tipe": "Pemasukan",
+        "Kategori": "💼 Gaji",
+        "Jumlah": rng.normal(30_000_000, 3_000_000, len(paydays)).round(-3),
+    })
+    return pd.concat([expense, income]).sort_values("Tanggal", ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=projection.N_PATHS)
+    parser.add_argument("--days", type=int, default=3650)
+    args = parser.parse_args()
+
+    df_daily = make_daily(args.days)
+    target = projection.current_balance(df_daily) + 50_000_000
+    print(f"daily_rows={len(df_daily):,} paths={args.paths:,}")
+    history = timed("monthly history", lambda: projection.monthly_history(df_daily))
+    paths = timed("simulate", lambda: projection.simulate(history, n_paths=args.paths))
+    timed("percentiles + target probability", lambda: projection.summarize(
+        paths, target, projection.HORIZON_MONTHS, history.index.max() + 2))
+    result = timed("project (end to end)", lambda: projection.project(
+        df_daily, target, projection.HORIZON_MONTHS, n_paths=args.paths))
+    print(f"history months: {result['history_months']}, P(target): {result['probability']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
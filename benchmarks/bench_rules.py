@@ -0,0 +1,68 @@
+"""Benchmark auto-kategori Catatan dengan regex gabungan.
+
+Jalankan dari root repo::
+
+    python benchmarks/bench_rules.py --notes 100000 --rules 300
+"""
+
+import argparse
+import random
+
+import pandas as pd
+
+from common import CATEGORIES, timed  # juga menambahkan root repo ke sys.path
+
+from financekita import rules
+
+FILLER = ["bayar", "beli", "transfer", "ke", "untuk", "di", "pagi", "malam", "dengan", "teman",
+          "kantor", "rumah", "debit", "qris", "ref", "trx"]
+
+
+def make_rules(n_rules, seed=0):
+    """Aturan sintetis: merchant acak + beberapa kata kunci umum."""
+    rng = random.Random(seed)
+    keywords = {"grab", "grabfood", "gojek", "indomaret", "alfamart", "pln", "netflix", "kopi"}
+    while len(keywords) < n_rules:
+        keywords.add("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))))
+    return pd.DataFrame({
+        "Kata Kunci": sorted(keywords),
+        "Kategori": [rng.choice(CATEGORIES) for _ in keywords],
+    })
+
+
+def make_notes(n_notes, keywords, seed=1):
+    """Catatan mutasi rekening sintetis; ~70% mengandung salah satu kata kunci."""
+    rng = random.Random(seed)
+    keywords = list(keywords)
+    notes = []
+    for _ in range(n_notes):
+        words = rng.sample(FILLER, k=rng.randint(2, 6))
+        if rng.random() < 0.7:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords).upper())
+        notes.append(" ".join(words) + f" {rng.randint(0, 10**8):08d}")
+    return pd.Series(notes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--rules", type=int, default=300)
+    parser.add_argument("--new-rules", type=int, default=10, help="aturan yang ditambahkan belakangan")
+    args = parser.parse_args()
+
+    df_rules = make_rules(args.rules + args.new_rules)
+    all_rules = rules.normalize_rules(df_rules)
+    old_rules = rules.normalize_rules(df_rules.iloc[:args.rules])
+    notes = make_notes(args.notes, all_rules)
+
+    print(f"notes={args.notes:,} rules={args.rules:,} new_rules={args.new_rules:,}")
+    categories, state = timed("full pass", lambda: rules.categorize(notes, old_rules))
+    print(f"categorized: {categories.notna().mean():.1%}")
+    timed("re-check unchanged rules", lambda: rules.categorize(notes, old_rules, state))
+    incremental, _ = timed("incremental (new rules only)", lambda: rules.categorize(notes, all_rules, state))
+    full, _ = timed("full pass with new rules", lambda: rules.categorize(notes, all_rules))
+    print(f"incremental == full: {incremental.equals(full)}")
+
+
+if __name__ == "__main__":
+    main()
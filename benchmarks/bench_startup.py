@@ -0,0 +1,107 @@
+"""Benchmark waktu startup: import modul dashboard dan render pertama.
+
+Setiap pengukuran berjalan di proses Python baru agar cache import dan
+``st.cache_resource`` benar-benar dingin. Render memakai worksheet palsu dari
+``loadtest.py`` (tanpa latensi jaringan) sehingga yang terukur hanya biaya app.
+
+Jalankan dari root repo::
+
+    python benchmarks/bench_startup.py --repeat 5 --rows 5000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# gspread tidak dicek di sini: worksheet palsu loadtest sudah meng-import-nya
+HEAVY_MODULES = ["plotly.graph_objects", "altair", "pandas", "numpy"]
+
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def time_import(module):
+    """Waktu import dingin satu modul (detik), di proses terpisah."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET.format(module=module)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def render_child(n_rows):
+    """Dijalankan di proses anak: dua render AppTest berurutan, hasil dicetak sebagai JSON."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import loadtest
+
+    loadtest.install_fake_worksheet(loadtest.FakeWorksheet(n_rows))
+    at = loadtest.new_session()
+
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    loaded = {module: module in sys.modules for module in HEAVY_MODULES}
+
+    start = time.perf_counter()
+    at.run()
+    second = time.perf_counter() - start
+
+    print(json.dumps({
+        "first": first,
+        "second": second,
+        "loaded": loaded,
+        "errors": [exc.message for exc in at.exception],
+    }))
+
+
+def time_render(n_rows):
+    with tempfile.TemporaryDirectory() as rollup_dir:
+        env = dict(os.environ, FINANCEKITA_ROLLUP_DIR=rollup_dir)
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", "--rows", str(n_rows)],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="jumlah proses per pengukuran")
+    parser.add_argument("--rows", type=int, default=5_000, help="baris worksheet palsu")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        render_child(args.rows)
+        return
+
+    print(f"{'import (median of ' + str(args.repeat) + ')':<36} {'detik':>8}")
+    for module in ["streamlit", "financekita.data", "financekita.ui", "gspread", "plotly.graph_objects"]:
+        median = np.median([time_import(module) for _ in range(args.repeat)])
+        print(f"{module:<36} {median:8.3f}")
+
+    runs = [time_render(args.rows) for _ in range(args.repeat)]
+    print()
+    print(f"render rows={args.rows:,}")
+    print(f"{'first render (cold)':<36} {np.median([run['first'] for run in runs]):8.3f}")
+    print(f"{'second render (warm)':<36} {np.median([run['second'] for run in runs]):8.3f}")
+    for module in HEAVY_MODULES:
+        print(f"{'loaded after first render: ' + module:<52} {runs[-1]['loaded'][module]}")
+    for message in runs[-1]["errors"]:
+        print(f"    ! {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Fixture bersama skrip benchmark: path repo, kategori contoh dan pengukur waktu.
+
+Skrip dijalankan sebagai file (``python benchmarks/<nama>.py``) sehingga
+direktori ini ada di ``sys.path``; meng-import modul ini menambahkan root repo
+agar paket ``financekita`` bisa di-import.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+CATEGORIES = ["🏠 Rumah Tangga", "🍔 Makanan", "🚗 Transportasi", "🧾 Tagihan", "👨‍⚕️ Kesehatan",
+              "🎉 Hiburan", "📚 Pendidikan", "🛒 Belanja", "🎁 Hadiah/Amal", "Lainnya"]
+
+
+def timed(label, fn):
+    """Menjalankan ``fn`` sekali, mencetak durasinya, lalu mengembalikan hasilnya."""
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<40} {time.perf_counter() - start:8.3f} s")
+    return result
@@ -0,0 +1,326 @@
+"""Load test headless: banyak sesi simulasi terhadap worksheet palsu in-process.
+
+Setiap sesi adalah ``streamlit.testing.v1.AppTest`` sendiri (session state
+terpisah, cache proses dipakai bersama seperti di server sungguhan). Sesi
+menjalankan skenario interaksi acak: ganti filter, pindah tampilan tab,
+cari catatan, ganti halaman tabel dan sesekali submit transaksi.
+
+AppTest tidak thread-safe (state widget antar sesi bisa tertukar), jadi
+interaksi dan rerun dijalankan bergantian di bawah satu lock dan latensi
+hanya mengukur rerun app itu sendiri, tanpa waktu menunggu lock. Sesi yang
+gagal (termasuk run pertama) dihitung di kolom "failed" dan tidak ikut
+persentil.
+
+Setiap konfigurasi (jumlah sesi × baris) berjalan di proses Python baru
+dengan direktori arsip sendiri, sehingga cache dingin dan kolom "peak MB"
+adalah puncak RSS konfigurasi itu saja.
+
+Jalankan dari root repo::
+
+    python benchmarks/loadtest.py --sessions 1 5 20 --rows 1000 50000 \\
+        --read-latency 0.3 --write-latency 0.5
+"""
+
+import argparse
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+HEADER = ["Tanggal", "Tipe", "Kategori", "Jumlah", "Catatan"]
+EXPENSE_CATEGORIES = ["🏠 Rumah Tangga", "🍔 Makanan", "🚗 Transportasi", "🧾 Tagihan",
+                      "🎉 Hiburan", "🛒 Belanja"]
+INCOME_CATEGORIES = ["💼 Gaji", "💰 Bonus", "💻 Freelance"]
+NOTES = ["kopi", "grab", "indomaret", "listrik", "nonton", "gaji bulanan", ""]
+SEARCHES = ["", "kopi", "grab", "listrik", "gaji"]
+
+
+class FakeWorksheet:
+    """Worksheet gspread palsu dengan latensi buatan dan penghitung panggilan."""
+
+    def __init__(self, n_rows, read_latency=0.0, write_latency=0.0, seed=0):
+        self.read_latency = read_latency
+        self.write_latency = write_latency
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        self.values = [HEADER] + self._make_rows(n_rows, seed)
+
+    @staticmethod
+    def _make_rows(n_rows, seed):
+        rng = random.Random(seed)
+        today = date.today()
+        start = today - timedelta(days=730)
+        rows = []
+        for i in range(n_rows):
+            day = start + timedelta(days=i * 730 // max(n_rows, 1))
+            if rng.random() < 0.1:
+                rows.append([day.isoformat(), "Pemasukan", rng.choice(INCOME_CATEGORIES),
+                             str(rng.randint(1, 20) * 500_000), "gaji bulanan"])
+            else:
+                rows.append([day.isoformat(), "Pengeluaran", rng.choice(EXPENSE_CATEGORIES),
+                             str(rng.randint(1, 300) * 1_000), rng.choice(NOTES)])
+        return rows
+
+    def _read(self, name):
+        self.calls[name] += 1
+        time.sleep(self.read_latency)
+
+    def get_all_records(self):
+        self._read("get_all_records")
+        with self._lock:
+            return [dict(zip(self.values[0], row)) for row in self.values[1:]]
+
+    def get_all_values(self):
+        self._read("get_all_values")
+        with self._lock:
+            return [list(row) for row in self.values]
+
+    def row_values(self, row):
+        self._read("row_values")
+        with self._lock:
+            return list(self.values[row - 1]) if len(self.values) >= row else []
+
+    def batch_get(self, ranges):
+        self._read("batch_get")
+        with self._lock:
+            return [self._range(name) for name in ranges]
+
+    def get(self, name):
+        self._read("get")
+        with self._lock:
+            return self._range(name)
+
+    def _range(self, name):
+        # Hanya bentuk range yang dipakai app: "1:1", "A<n>:Z<n>" dan "A<n>:Z"
+        first, last = name.split(":")
+        start_row = int("".join(ch for ch in first if ch.isdigit()))
+        last_digits = "".join(ch for ch in last if ch.isdigit())
+        end_row = int(last_digits) if last_digits else len(self.values)
+        return [list(row) for row in self.values[start_row - 1:end_row]]
+
+    def append_row(self, row, **kwargs):
+        self.calls["append_row"] += 1
+        time.sleep(self.write_latency)
+        with self._lock:
+            self.values.append([str(value) for value in row])
+
+    def update_cell(self, row, col, value):
+        self.calls["update_cell"] += 1
+        time.sleep(self.write_latency)
+        with self._lock:
+            cells = self.values[row - 1]
+            cells.extend([""] * (col - len(cells)))
+            cells[col - 1] = value
+
+
+class _FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+
+    def worksheet(self, name):
+        return self._worksheet
+
+
+class _FakeClient:
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+
+    def open_by_url(self, url):
+        return _FakeSpreadsheet(self._worksheet)
+
+
+def install_fake_worksheet(worksheet):
+    """Mengganti koneksi gspread app dengan worksheet palsu."""
+    import gspread
+    gspread.service_account_from_dict = lambda creds: _FakeClient(worksheet)
+
+
+def new_session():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    at.secrets["gsheets_credentials"] = {"type": "service_account"}
+    at.secrets["GSHEET_URL"] = "https://docs.google.com/spreadsheets/d/loadtest"
+    at.secrets["WORKSHEET_NAME"] = "Data"
+    return at
+
+
+def _widget(elements, key):
+    for element in elements:
+        if element.key == key:
+            return element
+    return None
+
+
+def _step_filter(at, rng):
+    widget = at.multiselect[0]
+    options = list(widget.options)
+    widget.set_value(rng.sample(options, k=rng.randint(1, len(options))))
+
+
+def _step_calendar_view(at, rng):
+    widget = _widget(at.radio, "calendar_view")
+    if widget is not None:
+        widget.set_value(rng.choice(list(widget.options)))
+
+
+def _step_search(at, rng):
+    widget = _widget(at.text_input, "search_input")
+    if widget is not None:
+        widget.set_value(rng.choice(SEARCHES))
+
+
+def _step_page(at, rng):
+    widget = _widget(at.button, rng.choice(["page_next", "page_last", "page_first"]))
+    if widget is not None:
+        widget.click()
+
+
+def _step_detail_source(at, rng):
+    widget = _widget(at.selectbox, "detail_source")
+    if widget is not None:
+        widget.set_value(rng.choice(list(widget.options)))
+
+
+def _step_submit(at, rng):
+    for button in at.button:
+        if "Tambah Transaksi" in str(button.label):
+            button.click()
+            return
+
+
+STEPS = {
+    "filter": _step_filter,
+    "tab": _step_calendar_view,
+    "search": _step_search,
+    "page": _step_page,
+    "detail": _step_detail_source,
+}
+
+
+_APPTEST_LOCK = threading.Lock()
+
+
+def _run_step(at, step, rng):
+    """Interaksi + rerun di bawah lock AppTest; mengembalikan durasi rerun saja."""
+    with _APPTEST_LOCK:
+        if step is not None:
+            step(at, rng)
+        start = time.perf_counter()
+        at.run()
+        return time.perf_counter() - start
+
+
+def run_session(session_id, n_interactions, submit_every, latencies, errors):
+    """Satu sesi simulasi; mencatat latensi ``(session_id, langkah, detik)`` & error ``(session_id, pesan)``."""
+    rng = random.Random(session_id)
+    at = new_session()
+
+    for i in range(n_interactions + 1):
+        if i == 0:
+            name, step = "initial", None
+        elif submit_every and i % submit_every == 0:
+            name, step = "submit", _step_submit
+        else:
+            name = rng.choice(list(STEPS))
+            step = STEPS[name]
+        try:
+            elapsed = _run_step(at, step, rng)
+        except Exception as exc:  # noqa: BLE001 - harness harus tetap jalan
+            errors.append((session_id, f"{name}: {exc}"))
+            failed = True
+        else:
+            errors.extend((session_id, f"{name}: {exc.message}") for exc in at.exception)
+            failed = bool(at.exception)
+            latencies.append((session_id, name, elapsed))
+        if failed and i == 0:
+            # Tanpa run pertama yang berhasil tidak ada widget untuk diinteraksikan
+            return
+
+
+def peak_rss_mb():
+    # ru_maxrss: kilobyte di Linux, byte di macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def run_config(n_sessions, n_rows, args):
+    """Dijalankan di proses anak: satu konfigurasi, satu baris tabel hasil."""
+    worksheet = FakeWorksheet(n_rows, args.read_latency, args.write_latency)
+    install_fake_worksheet(worksheet)
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_sessions) as pool:
+        futures = [
+            pool.submit(run_session, i, args.interactions, args.submit_every, latencies, errors)
+            for i in range(n_sessions)
+        ]
+        for future in futures:
+            future.result()
+    wall = time.perf_counter() - start
+
+    # Persentil hanya dari sesi yang seluruh run-nya berhasil; sisanya dihitung di "failed"
+    failed = {session_id for session_id, _ in errors}
+    times = np.array([t for session_id, _, t in latencies if session_id not in failed]) * 1000
+    p50, p90, p99 = np.percentile(times, [50, 90, 99]) if len(times) else (np.nan,) * 3
+    reads = sum(count for name, count in worksheet.calls.items() if name not in ("append_row", "update_cell"))
+    writes = worksheet.calls["append_row"] + worksheet.calls["update_cell"]
+    print(f"{n_sessions:>8} {n_rows:>9,} {len(failed):>6} {len(times):>7} {p50:>8.0f} {p90:>8.0f} {p99:>8.0f} "
+          f"{reads:>6} {writes:>6} {peak_rss_mb():>9.0f} {wall:>7.1f}s")
+    for session_id, message in errors[:5]:
+        print(f"    ! session {session_id} {message}")
+    if args.verbose:
+        print(f"    sheets calls: {dict(worksheet.calls)}")
+
+
+def run_config_in_subprocess(n_sessions, n_rows, args):
+    """Menjalankan ``run_config`` di proses baru; output anak langsung diteruskan."""
+    child_args = [
+        "--child", "--sessions", str(n_sessions), "--rows", str(n_rows),
+        "--interactions", str(args.interactions), "--submit-every", str(args.submit_every),
+        "--read-latency", str(args.read_latency), "--write-latency", str(args.write_latency),
+    ] + (["--verbose"] if args.verbose else [])
+    with tempfile.TemporaryDirectory() as rollup_dir:
+        env = dict(os.environ, FINANCEKITA_ROLLUP_DIR=rollup_dir)
+        subprocess.run([sys.executable, __file__] + child_args, env=env, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 20_000])
+    parser.add_argument("--interactions", type=int, default=10, help="interaksi per sesi")
+    parser.add_argument("--submit-every", type=int, default=0,
+                        help="submit transaksi tiap N interaksi (0 = tidak pernah)")
+    parser.add_argument("--read-latency", type=float, default=0.2, help="detik per panggilan baca Sheets")
+    parser.add_argument("--write-latency", type=float, default=0.4, help="detik per append_row")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_config(args.sessions[0], args.rows[0], args)
+        return
+
+    print(f"{'sessions':>8} {'rows':>9} {'failed':>6} {'reruns':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+          f"{'reads':>6} {'writes':>6} {'peak MB':>9} {'wall':>8}", flush=True)
+    for n_rows in args.rows:
+        for n_sessions in args.sessions:
+            run_config_in_subprocess(n_sessions, n_rows, args)
+
+
+if __name__ == "__main__":
+    main()
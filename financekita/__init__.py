@@ -0,0 +1 @@
+"""FinanceKita: dashboard keuangan pribadi di atas Google Sheets."""
@@ -0,0 +1,222 @@
+"""Analitik di atas frame total harian: kalender, urutan tabel, anomali, forecast & budget."""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from financekita import anomaly, rolling
+from financekita.data import read_rollup_manifest, shared_ledger
+
+
+def build_expense_calendar(df):
+    """Seri pengeluaran harian seluruh riwayat dalam satu pass, dipecah per bulan.
+    
+    Mengembalikan ``(df_calendar, months, month_stats)``: kalender lengkap
+    (hari tanpa pengeluaran bernilai 0), dict ``{YYYY-MM: frame bulan}`` untuk
+    lookup cepat, dan statistik per bulan untuk kartu di tab Kalender.
+    """
+    daily_spend = df[df['Tipe'] == 'Pengeluaran'].groupby('Tanggal')['Jumlah'].sum()
+    
+    first_day = df['Tanggal'].min().normalize().replace(day=1)
+    last_day = df['Tanggal'].max().normalize() + pd.offsets.MonthEnd(0)
+    all_days = pd.date_range(first_day, last_day, freq='D', name='Tanggal')
+    
+    df_calendar = daily_spend.reindex(all_days, fill_value=0).reset_index()
+    df_calendar['Bulan-Tahun'] = df_calendar['Tanggal'].dt.strftime('%Y-%m')
+    df_calendar['Tahun'] = df_calendar['Tanggal'].dt.year
+    df_calendar['day'] = df_calendar['Tanggal'].dt.day
+    df_calendar['week'] = df_calendar['Tanggal'].dt.isocalendar().week.to_numpy()
+    df_calendar['weekday'] = df_calendar['Tanggal'].dt.dayofweek
+    
+    # Statistik bulan: hari dengan transaksi apa pun vs hari dengan pengeluaran
+    active_days = df['Tanggal'].drop_duplicates()
+    month_stats = pd.DataFrame({
+        'Total': df_calendar.groupby('Bulan-Tahun')['Jumlah'].sum(),
+        'Hari Pengeluaran': (df_calendar['Jumlah'] > 0).groupby(df_calendar['Bulan-Tahun']).sum(),
+        'Hari Transaksi': active_days.groupby(active_days.dt.strftime('%Y-%m')).size(),
+    }).fillna(0)
+    
+    months = {month: frame for month, frame in df_calendar.groupby('Bulan-Tahun')}
+    return df_calendar, months, month_stats
+
+# Opsi urutan tabel Data: label -> (kolom, ascending)
+SORT_OPTIONS = {
+    "Tanggal (Terbaru)": ("Tanggal", False),
+    "Tanggal (Terlama)": ("Tanggal", True),
+    "Jumlah (Terbesar)": ("Jumlah", False),
+    "Jumlah (Terkecil)": ("Jumlah", True),
+}
+
+def build_sort_orders(df_detail):
+    """Permutasi posisi baris untuk tiap opsi urutan (argsort stabil), dihitung sekali."""
+    orders = {}
+    for label, (column, ascending) in SORT_OPTIONS.items():
+        values = df_detail[column].to_numpy()
+        if column == 'Tanggal':
+            values = values.astype('datetime64[ns]').view('int64')
+        orders[label] = np.argsort(values if ascending else -values, kind='stable')
+    return orders
+
+def _archive_marker():
+    """Penanda isi arsip: berubah saat arsip dibangun ulang atau kategorinya dinilai ulang."""
+    manifest = read_rollup_manifest()
+    return manifest.get("generation", 0), manifest.get("rules_version")
+
+def detect_anomalies_with_cache(df, df_live):
+    """Anomali hari & transaksi; state EWMA bersama diperbarui inkremental tiap revisi data."""
+    shared = shared_ledger()
+    revision = st.session_state.get('data_revision', 0)
+    if shared["anomaly_revision"] != revision:
+        archive = _archive_marker()
+        # Total harian arsip berubah: stream dinilai ulang dari awal
+        states = shared["anomaly_states"] if shared["anomaly_archive"] == archive else None
+        flagged_days, flagged_transactions, states = anomaly.update_anomalies(df, df_live, states)
+        shared.update(
+            anomaly_states=states,
+            anomalies=(flagged_days, flagged_transactions),
+            anomaly_revision=revision,
+            anomaly_archive=archive,
+        )
+    return shared["anomalies"]
+
+def rolling_with_cache(snapshot):
+    """Prefix sum jendela bergulir untuk satu ``LedgerSnapshot``; state bersama diperbarui inkremental.
+    
+    Watermark adalah tanggal paling awal di antara data live dan baris live
+    yang berubah/terhapus sejak update sebelumnya. Reset arsip, kategori
+    arsip yang dinilai ulang, atau snapshot hasil map dari replika lain
+    membuat state dihitung ulang.
+    """
+    shared = shared_ledger()
+    if shared["rolling_revision"] != snapshot.revision:
+        df_live = snapshot.live
+        archive = _archive_marker()
+        state, watermark = shared["rolling_state"], None
+        if (snapshot.source in ("sheets", "rules") and shared["rolling_live"] is not None
+                and shared["rolling_archive"] == archive and not df_live.empty):
+            # Baris sebelum data live berasal dari arsip yang tidak berubah
+            watermark = df_live['Tanggal'].min()
+            changed = anomaly.earliest_change(df_live, shared["rolling_live"])
+            if changed is not None and not pd.isna(changed):
+                watermark = min(watermark, changed)
+        shared.update(
+            rolling_state=rolling.update_state(snapshot.daily, state, watermark),
+            rolling_revision=snapshot.revision,
+            rolling_live=df_live,
+            rolling_archive=archive,
+        )
+    return shared["rolling_state"]
+
+def forecast_next_month(df):
+    """Prediksi pengeluaran bulan depan."""
+    try:
+        df_monthly = df[df['Tipe'] == 'Pengeluaran']
+        monthly_totals = df_monthly.groupby(df_monthly['Tanggal'].dt.to_period('M'))['Jumlah'].sum().tail(3)
+        
+        if len(monthly_totals) >= 2:
+            weights = [0.5, 0.3, 0.2][:len(monthly_totals)]
+            forecast = (monthly_totals * weights[:len(monthly_totals)]).sum()
+            return forecast
+    except:
+        pass
+    return None
+
+def calculate_budget_vs_actual(df, budget_settings):
+    """Menghitung perbandingan budget vs actual spending."""
+    results = []
+    df_pengeluaran = df[df['Tipe'] == 'Pengeluaran']
+    spend_by_category = df_pengeluaran.groupby('Kategori')['Jumlah'].sum()
+    
+    for category, budget in budget_settings.items():
+        # Cari kategori yang mengandung nama category (case-insensitive)
+        actual = 0
+        for cat, jumlah in spend_by_category.items():
+            # PERBAIKAN DI SINI: Cek jika 'cat' adalah string sebelum memanggil .lower()
+            if isinstance(cat, str) and category.lower() in cat.lower():
+                actual += jumlah
+        
+        if budget > 0:
+            percentage = (actual / budget) * 100 if budget > 0 else 0
+            status = "🟢" if percentage <= 80 else "🟡" if percentage <= 100 else "🔴"
+            results.append({
+                'Kategori': category,
+                'Budget': budget,
+                'Actual': actual,
+                'Percentage': percentage,
+                'Status': status
+            })
+    
+    return pd.DataFrame(results)
+
+def calculate_burn_rate(rolling_state, budget_settings, as_of):
+    """Laju pengeluaran 7 & 30 hari terakhir per kategori budget, diproyeksikan ke 30 hari."""
+    spend = rolling.category_spend(rolling_state, as_of, windows=(7, 30))
+    results = []
+    for category, budget in budget_settings.items():
+        if budget <= 0:
+            continue
+        # Pencocokan kategori sama dengan calculate_budget_vs_actual
+        matching = [isinstance(cat, str) and category.lower() in cat.lower() for cat in spend.index]
+        spend_7, spend_30 = spend[matching].sum()
+        projected = spend_7 / 7 * 30
+        pace = projected / budget * 100
+        results.append({
+            'Kategori': category,
+            'Budget': budget,
+            '7 Hari': spend_7,
+            '30 Hari': spend_30,
+            'Proyeksi 30 Hari': projected,
+            'Laju': pace,
+            'Status': "🟢" if pace <= 80 else "🟡" if pace <= 100 else "🔴",
+        })
+    return pd.DataFrame(results)
+
+# Kolom hasil perbandingan periode: (periode berjalan, periode sebelumnya, tahun lalu)
+PERIOD_WINDOWS = ["", " Sebelumnya", " Tahun Lalu"]
+
+def build_period_totals(df):
+    """Prefix sum harian per (Tipe, Kategori) untuk total rentang tanggal apa pun.
+    
+    Total harian di-pivot sekali menjadi matriks tanggal × kategori lalu
+    dijumlahkan kumulatif; total sebuah rentang cukup dua lookup baris.
+    """
+    pivot = df.pivot_table(
+        index='Tanggal', columns=['Tipe', 'Kategori'], values=['Jumlah', 'Transaksi'],
+        aggfunc='sum', fill_value=0, observed=True
+    )
+    keys = pivot['Jumlah'].columns
+    values = np.stack([pivot['Jumlah'][keys].to_numpy(float), pivot['Transaksi'][keys].to_numpy(float)])
+    # Baris nol di depan: total rentang = cum[hi] - cum[lo]
+    cumulative = np.concatenate([np.zeros((2, 1, len(keys))), values.cumsum(axis=1)], axis=1)
+    return pivot.index.to_numpy().astype('datetime64[ns]'), keys, cumulative
+
+def compare_periods(period_totals, start_date, end_date):
+    """Total per (Tipe, Kategori) untuk rentang terpilih, rentang sebelumnya & tahun lalu.
+    
+    Rentang sebelumnya sama panjang dan berakhir tepat sebelum ``start_date``;
+    tahun lalu adalah rentang yang sama digeser 12 bulan. Ketiga jendela
+    dihitung sekaligus dari prefix sum, tanpa menyaring frame lagi.
+    """
+    dates, keys, cumulative = period_totals
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date) + pd.Timedelta(days=1)
+    length = end - start
+    year = pd.DateOffset(years=1)
+    bounds = np.array([
+        [start, end],
+        [start - length, start],
+        [start - year, end - year],
+    ], dtype='datetime64[ns]')
+    lo, hi = np.searchsorted(dates, bounds, side='left').T
+    totals = cumulative[:, hi, :] - cumulative[:, lo, :]
+    
+    columns = {}
+    for window, suffix in enumerate(PERIOD_WINDOWS):
+        columns[f'Jumlah{suffix}'] = totals[0, window]
+        columns[f'Transaksi{suffix}'] = totals[1, window].astype(int)
+    return pd.DataFrame(columns, index=keys)
+
+def percent_change(current, previous):
+    """Perubahan relatif dalam persen; NaN bila periode pembanding kosong."""
+    current, previous = np.asarray(current, dtype=float), np.asarray(previous, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(previous != 0, (current - previous) / np.abs(previous) * 100, np.nan)
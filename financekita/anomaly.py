@@ -0,0 +1,201 @@
+"""Deteksi anomali pengeluaran berbasis statistik EWMA per kategori.
+
+Modul ini murni pandas/NumPy (tanpa Streamlit) supaya bisa dipakai ulang dan
+di-benchmark terpisah dari halaman dashboard.
+
+Setiap "stream" observasi (misalnya total harian per kategori, atau transaksi
+individual) punya state berisi rata-rata EWMA, momen kedua EWMA dan jumlah
+observasi per kategori, ditambah ``watermark`` tanggal. Observasi sebelum
+watermark sudah dilipat ke state; saat data baru datang hanya observasi
+mulai watermark yang diproses ulang. Baris susulan (tanggal sebelum
+watermark) tidak bisa disambung ke state, sehingga stream itu dibangun ulang.
+"""
+
+import numpy as np
+import pandas as pd
+
+ANOMALY_ALPHA = 0.1       # bobot EWMA, kira-kira memori ~20 observasi terakhir
+ANOMALY_SIGMA = 3.0       # ambang: rata-rata + 3 standar deviasi
+ANOMALY_MIN_OBS = 5       # kategori dengan riwayat lebih pendek tidak dinilai
+
+TOTAL_HARIAN = "📆 Total Harian"
+
+
+def empty_state():
+    """State awal tanpa riwayat."""
+    return {
+        "stats": pd.DataFrame(columns=["mean", "sq", "n"], dtype="float64"),
+        "watermark": None,
+        "flags": None,
+    }
+
+
+def score_observations(obs, state=None, alpha=ANOMALY_ALPHA, sigma=ANOMALY_SIGMA,
+                       min_obs=ANOMALY_MIN_OBS):
+    """Menilai observasi ``(Tanggal, Kategori, Jumlah)`` terhadap statistik EWMA sebelumnya.
+
+    Hanya observasi dengan ``Tanggal >= watermark`` yang diproses. Statistik
+    per kategori disambung dari state lama dengan menaruhnya sebagai baris
+    "seed" di depan tiap grup, sehingga EWMA (``adjust=False``) melanjutkan
+    rekurensi yang sama tanpa menghitung ulang seluruh riwayat.
+
+    Returns:
+        ``(scored, new_state)`` — ``scored`` adalah observasi yang diproses
+        dengan kolom tambahan ``Rata-rata``, ``Std``, ``Skor-Z`` dan ``Anomali``.
+        ``new_state["flags"]`` berisi semua observasi yang pernah ditandai.
+    """
+    state = state or empty_state()
+    watermark = state["watermark"]
+    tail = obs if watermark is None else obs[obs["Tanggal"] >= watermark]
+    if tail.empty:
+        return tail.assign(Anomali=pd.Series(dtype=bool)), state
+
+    stats = state["stats"]
+    seeds = stats[stats.index.isin(tail["Kategori"].unique())]
+    n_seed = len(seeds)
+
+    # Seed di depan tiap kategori, lalu observasi baru urut tanggal.
+    # Semua operasi per grup memakai kode kategori integer pada array terurut.
+    tail_codes, categories = pd.factorize(tail["Kategori"])
+    codes = np.concatenate([categories.get_indexer(seeds.index), tail_codes])
+    day = np.concatenate([np.full(n_seed, np.iinfo(np.int64).min),
+                          tail["Tanggal"].to_numpy(dtype="datetime64[ns]").astype(np.int64)])
+    order = np.lexsort((day, codes))
+
+    x = np.concatenate([seeds["mean"].to_numpy(dtype="float64"), tail["Jumlah"].to_numpy(dtype="float64")])[order]
+    x2 = np.concatenate([seeds["sq"].to_numpy(dtype="float64"), np.square(tail["Jumlah"].to_numpy(dtype="float64"))])[order]
+    seed_n = np.concatenate([seeds["n"].to_numpy(dtype="float64"), np.zeros(len(tail))])[order]
+    is_seed = order < n_seed
+    code = codes[order]
+
+    # EWMA (adjust=False) per kategori; hasil groupby urut kode = urutan array
+    ewm = pd.DataFrame({"code": code, "x": x, "x2": x2}).groupby("code", sort=True)[["x", "x2"]]
+    ewm = ewm.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    mean, sq = ewm[:, 0], ewm[:, 1]
+
+    # Statistik "sebelum" observasi ini = nilai EWMA baris sebelumnya dalam kategori
+    positions = np.arange(len(code))
+    first = np.r_[True, code[1:] != code[:-1]]
+    group_start = np.maximum.accumulate(np.where(first, positions, 0))
+    prev_mean = np.where(first, np.nan, np.roll(mean, 1))
+    prev_sq = np.where(first, np.nan, np.roll(sq, 1))
+    n_prev = seed_n[group_start] + positions - group_start - is_seed[group_start]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        prev_std = np.sqrt(np.maximum(prev_sq - np.square(prev_mean), 0))
+        z_score = np.where(prev_std > 0, (x - prev_mean) / prev_std, np.nan)
+        flagged = (n_prev >= min_obs) & (prev_std > 0) & (x > prev_mean + sigma * prev_std)
+
+    # Kembalikan ke urutan observasi asli
+    obs_mask = ~is_seed
+    back = np.empty(len(tail), dtype=np.int64)
+    back[order[obs_mask] - n_seed] = np.flatnonzero(obs_mask)
+    scored = tail.assign(**{
+        "Rata-rata": prev_mean[back],
+        "Std": prev_std[back],
+        "Skor-Z": z_score[back],
+        "Anomali": flagged[back],
+    })
+    rows = pd.DataFrame({
+        "Kategori": categories.take(code[obs_mask]),
+        "Tanggal": day[order][obs_mask].astype("datetime64[ns]"),
+        "mean": mean[obs_mask],
+        "sq": sq[obs_mask],
+        "n": (n_prev + 1)[obs_mask],
+    })
+
+    # Lipat observasi sebelum tanggal terakhir ke state; hari terakhir masih bisa bertambah
+    new_watermark = tail["Tanggal"].max()
+    folded = rows[rows["Tanggal"] < new_watermark]
+    last = folded.groupby("Kategori", sort=False).tail(1).set_index("Kategori")[["mean", "sq", "n"]]
+    new_stats = pd.concat([stats[~stats.index.isin(last.index)], last])
+
+    old_flags = state["flags"]
+    if old_flags is not None and watermark is not None:
+        old_flags = old_flags[old_flags["Tanggal"] < watermark]
+    new_flags = pd.concat([old_flags, scored[scored["Anomali"]]]) if old_flags is not None else scored[scored["Anomali"]]
+
+    return scored, {"stats": new_stats, "watermark": new_watermark, "flags": new_flags}
+
+
+def daily_observations(df_daily, since=None):
+    """Observasi harian pengeluaran per kategori plus total harian, dari frame total harian."""
+    df_exp = df_daily[df_daily["Tipe"] == "Pengeluaran"]
+    if since is not None:
+        df_exp = df_exp[df_exp["Tanggal"] >= since]
+
+    per_category = df_exp.groupby(["Tanggal", "Kategori"])["Jumlah"].sum().reset_index()
+    per_day = df_exp.groupby("Tanggal")["Jumlah"].sum().reset_index().assign(Kategori=TOTAL_HARIAN)
+    return pd.concat([per_category, per_day], ignore_index=True)
+
+
+def transaction_observations(df_live, since=None):
+    """Observasi transaksi pengeluaran individual (index asli dipertahankan)."""
+    df_exp = df_live[df_live["Tipe"] == "Pengeluaran"]
+    if since is not None:
+        df_exp = df_exp[df_exp["Tanggal"] >= since]
+    return df_exp[["Tanggal", "Kategori", "Jumlah", "Catatan"]]
+
+
+LIVE_COLUMNS = ["Tanggal", "Tipe", "Kategori", "Jumlah"]
+
+
+def earliest_change(df_live, seen):
+    """Tanggal paling awal dari baris live yang baru, berubah atau terhapus dibanding ``seen``.
+
+    Kedua frame ber-index nomor baris sheet. Baris lama di bawah index live
+    terkecil sudah dipindah ke arsip (totalnya tetap), jadi tidak dihitung.
+    Mengembalikan ``None`` bila tidak ada perubahan.
+    """
+    old, new = seen[LIVE_COLUMNS], df_live[LIVE_COLUMNS]
+    if len(new):
+        old = old[old.index >= new.index.min()]
+    joined = old.join(new, how="outer", lsuffix="_old")
+    changed = np.zeros(len(joined), dtype=bool)
+    for col in LIVE_COLUMNS:
+        before, after = joined[f"{col}_old"], joined[col]
+        changed |= ~((before == after) | (before.isna() & after.isna())).to_numpy()
+    if not changed.any():
+        return None
+    return pd.concat([joined.loc[changed, "Tanggal_old"], joined.loc[changed, "Tanggal"]]).min()
+
+
+def _restart_if_backdated(state, changed):
+    """State kosong bila ada perubahan sebelum watermark stream; selain itu state apa adanya."""
+    if changed is not None and state["watermark"] is not None and changed < state["watermark"]:
+        return empty_state()
+    return state
+
+
+def update_anomalies(df_daily, df_live, states=None):
+    """Memperbarui state anomali harian & transaksi secara inkremental.
+
+    Bila baris live baru/berubah bertanggal sebelum watermark sebuah stream
+    (input susulan, mutasi impor), stream itu dinilai ulang dari awal.
+
+    Returns:
+        ``(flagged_days, flagged_transactions, new_states)``.
+    """
+    states = states or {"daily": empty_state(), "transactions": empty_state(), "live": None}
+    changed = earliest_change(df_live, states["live"]) if states["live"] is not None else None
+    daily_state = _restart_if_backdated(states["daily"], changed)
+    txn_state = _restart_if_backdated(states["transactions"], changed)
+
+    daily_obs = daily_observations(df_daily, since=daily_state["watermark"])
+    _, daily_state = score_observations(daily_obs, daily_state)
+
+    txn_obs = transaction_observations(df_live, since=txn_state["watermark"])
+    _, txn_state = score_observations(txn_obs, txn_state)
+
+    # Frame live bersama read-only: cukup simpan referensinya untuk perbandingan berikutnya
+    new_states = {"daily": daily_state, "transactions": txn_state, "live": df_live}
+    flagged_days = _flags_or_empty(daily_state, daily_obs)
+    flagged_transactions = _flags_or_empty(txn_state, txn_obs)
+    return flagged_days, flagged_transactions, new_states
+
+
+def _flags_or_empty(state, obs):
+    """Flag dari state, atau frame kosong dengan dtype kolom observasi."""
+    if state["flags"] is not None:
+        return state["flags"]
+    return obs.iloc[:0].assign(**{"Rata-rata": 0.0, "Std": 0.0, "Skor-Z": 0.0, "Anomali": False})
@@ -0,0 +1,229 @@
+"""API JSON read-only lokal untuk ringkasan dashboard.
+
+Server HTTP kecil (thread di proses Streamlit) yang hanya membaca snapshot
+ledger bersama di memori; tidak pernah memanggil Google Sheets. Respons
+di-cache per revisi data + parameter dan diberi ETag, sehingga polling
+dengan ``If-None-Match`` cukup dijawab ``304 Not Modified``.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pandas as pd
+import streamlit as st
+
+from financekita.analytics import calculate_budget_vs_actual, forecast_next_month
+from financekita.data import REPORTING_CURRENCY, shared_ledger
+
+# Batas jumlah respons yang disimpan per revisi (query unik dari poller)
+MAX_CACHED_RESPONSES = 512
+
+
+class ApiError(Exception):
+    """Kesalahan yang dikembalikan ke klien sebagai JSON dengan status HTTP tertentu."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class SummaryResponder:
+    """Memetakan path ke fungsi ringkasan dan menyimpan hasilnya per revisi data.
+
+    ``routes`` berisi ``{path: fn(snapshot, params) -> dict}``. ``get_snapshot``
+    mengembalikan dict snapshot bersama (minimal berisi ``revision``).
+    ``version_of`` mengembalikan nilai tambahan yang ikut menentukan validitas
+    cache (misalnya setelan budget, atau tanggal hari ini untuk rentang default).
+    """
+
+    def __init__(self, get_snapshot, routes, version_of=lambda snapshot: ()):
+        self.get_snapshot = get_snapshot
+        self.routes = routes
+        self.version_of = version_of
+        self._cache = {}
+        self._cache_version = None
+        self._lock = threading.Lock()
+
+    def respond(self, path, params):
+        """Mengembalikan ``(etag, body_bytes)`` untuk path + query."""
+        route = self.routes.get(path)
+        if route is None:
+            raise ApiError(404, f"Endpoint tidak dikenal: {path}")
+
+        snapshot = self.get_snapshot()
+        if snapshot.get("daily") is None:
+            raise ApiError(503, "Data belum dimuat; buka dashboard sekali untuk memuat ledger.")
+
+        version = (snapshot["revision"], self.version_of(snapshot))
+        key = (path, tuple(sorted(params.items())))
+        with self._lock:
+            if self._cache_version != version:
+                self._cache = {}
+                self._cache_version = version
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            payload = route(snapshot, params)
+        except ValueError as exc:
+            raise ApiError(400, str(exc)) from exc
+
+        body = json.dumps(payload, ensure_ascii=False, default=_to_json).encode("utf-8")
+        etag = '"' + hashlib.sha1(repr((version, key)).encode("utf-8") + body).hexdigest()[:20] + '"'
+        with self._lock:
+            if self._cache_version == version and len(self._cache) < MAX_CACHED_RESPONSES:
+                self._cache[key] = (etag, body)
+        return etag, body
+
+
+def _to_json(value):
+    """Encoder untuk skalar NumPy/pandas dan tanggal."""
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FinanceKitaAPI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            etag, body = self.server.responder.respond(url.path.rstrip("/") or "/", dict(parse_qsl(url.query)))
+        except ApiError as exc:
+            self._send(exc.status, json.dumps({"error": exc.message}).encode("utf-8"))
+            return
+
+        if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+            self._send(304, b"", etag)
+        else:
+            self._send(200, body, etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Poller bisa ratusan request per detik; jangan banjiri log Streamlit
+        pass
+
+
+def serve_in_background(responder, host="127.0.0.1", port=8765):
+    """Menjalankan server di daemon thread dan mengembalikan objek server-nya."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.responder = responder
+    thread = threading.Thread(target=server.serve_forever, name="financekita-summary-api", daemon=True)
+    thread.start()
+    return server
+
+
+# Aktif bila FINANCEKITA_API_PORT di-set, mis. 8765 -> http://127.0.0.1:8765/api/summary
+API_HOST = os.environ.get("FINANCEKITA_API_HOST", "127.0.0.1")
+API_PORT = os.environ.get("FINANCEKITA_API_PORT")
+
+
+def _api_date_range(params):
+    """Rentang ``start``/``end`` (YYYY-MM-DD) dari query; default bulan berjalan."""
+    today = date.today()
+    start = date.fromisoformat(params.get("start", today.replace(day=1).isoformat()))
+    end = date.fromisoformat(params.get("end", today.isoformat()))
+    if end < start:
+        raise ValueError("end harus sama atau setelah start")
+    return start, end
+
+
+def _api_snapshot():
+    """Revisi, total harian dan budget dari satu ``LedgerSnapshot`` (tidak pernah campuran revisi)."""
+    shared = shared_ledger()
+    snapshot = shared["snapshot"]
+    return {
+        "revision": snapshot.revision,
+        "daily": snapshot.daily,
+        "budget_settings": shared["budget_settings"],
+    }
+
+
+def api_summary(snapshot, params):
+    """Total pemasukan, pengeluaran, saldo, forecast dan status budget untuk satu rentang."""
+    start, end = _api_date_range(params)
+    df = snapshot["daily"]
+    lo, hi = df['Tanggal'].searchsorted([pd.Timestamp(start), pd.Timestamp(end) + timedelta(days=1)])
+    df_range = df.iloc[lo:hi]
+    
+    totals = df_range.groupby('Tipe')['Jumlah'].sum()
+    pemasukan = float(totals.get('Pemasukan', 0))
+    pengeluaran = float(totals.get('Pengeluaran', 0))
+    forecast = forecast_next_month(df)
+    budget = calculate_budget_vs_actual(df_range, snapshot["budget_settings"])
+    
+    return {
+        "revision": snapshot["revision"],
+        "start": start,
+        "end": end,
+        "mata_uang": REPORTING_CURRENCY,
+        "pemasukan": pemasukan,
+        "pengeluaran": pengeluaran,
+        "saldo": pemasukan - pengeluaran,
+        "jumlah_transaksi": int(df_range['Transaksi'].sum()),
+        "forecast_bulan_depan": None if forecast is None else float(forecast),
+        "budget": budget.to_dict(orient="records"),
+    }
+
+
+def api_months(snapshot, params):
+    """Agregat per bulan: pemasukan, pengeluaran, saldo dan jumlah transaksi."""
+    df = snapshot["daily"]
+    bulan = df['Tanggal'].dt.strftime('%Y-%m').rename('Bulan')
+    monthly = df.groupby([bulan, 'Tipe'])[['Jumlah', 'Transaksi']].sum().unstack('Tipe', fill_value=0)
+    
+    pemasukan = monthly['Jumlah'].get('Pemasukan', pd.Series(0, index=monthly.index))
+    pengeluaran = monthly['Jumlah'].get('Pengeluaran', pd.Series(0, index=monthly.index))
+    return {
+        "revision": snapshot["revision"],
+        "mata_uang": REPORTING_CURRENCY,
+        "bulan": [
+            {
+                "bulan": month,
+                "pemasukan": float(pemasukan[month]),
+                "pengeluaran": float(pengeluaran[month]),
+                "saldo": float(pemasukan[month] - pengeluaran[month]),
+                "jumlah_transaksi": int(monthly['Transaksi'].loc[month].sum()),
+            }
+            for month in monthly.index
+        ],
+    }
+
+
+@st.cache_resource
+def start_summary_api(host, port):
+    """Menyalakan server API sekali per proses; hanya membaca snapshot bersama."""
+    responder = SummaryResponder(
+        _api_snapshot,
+        {"/api/summary": api_summary, "/api/months": api_months},
+        # Tanggal hari ini ikut versi: rentang default (bulan berjalan) bergeser tiap hari
+        version_of=lambda snapshot: (date.today(), tuple(sorted(snapshot["budget_settings"].items()))),
+    )
+    try:
+        return serve_in_background(responder, host, port)
+    except OSError as e:
+        st.warning(f"⚠️ API ringkasan tidak bisa dijalankan di {host}:{port}: {e}")
+        return None
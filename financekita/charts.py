@@ -0,0 +1,353 @@
+"""Pembuat chart dashboard (Altair; Plotly hanya untuk Sankey, di-import saat dipakai)."""
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+
+def create_donut_chart(df, title, color_scheme="category10"):
+    """Membuat Donut Chart Altair dari DataFrame dengan color scheme."""
+    if df.empty or df["Jumlah"].sum() == 0:
+        st.info(f"Tidak ada data untuk {title.lower()}.")
+        return None
+
+    total = df["Jumlah"].sum()
+    df['Persentase'] = (df['Jumlah'] / total)
+    df['Display'] = df.apply(lambda x: f"{x['Kategori']}: Rp{x['Jumlah']:,.0f} ({x['Persentase']:.1%})", axis=1)
+
+    base = alt.Chart(df).encode(
+        theta=alt.Theta("Jumlah:Q", stack=True),
+        order=alt.Order("Jumlah:Q", sort="descending")
+    ).properties(
+        title=alt.TitleParams(
+            text=title,
+            fontSize=16,
+            fontWeight="bold"
+        ),
+        height=300
+    )
+
+    donut = base.mark_arc(outerRadius=120, innerRadius=80).encode(
+        color=alt.Color("Kategori:N", 
+                       legend=alt.Legend(title="Kategori", columns=2),
+                       scale=alt.Scale(scheme=color_scheme)),
+        tooltip=[alt.Tooltip("Kategori:N", title="Kategori"),
+                alt.Tooltip("Jumlah:Q", title="Jumlah", format=",.0f"),
+                alt.Tooltip("Persentase:Q", title="Persentase", format=".1%")]
+    )
+
+    text_total = alt.Chart(pd.DataFrame({'Total': [f"Rp{total:,.0f}"]})).mark_text(
+        align='center', 
+        baseline='middle', 
+        fontSize=20,
+        fontWeight="bold",
+        color="#FFFFFF"
+    ).encode(
+        text=alt.Text('Total:N'),
+    )
+    
+    return donut + text_total
+
+def create_calendar_heatmap(df_calendar, year_month):
+    """Membuat Calendar Heatmap pengeluaran untuk bulan yang dipilih."""
+    if df_calendar is None or df_calendar['Jumlah'].sum() == 0:
+        st.info("Tidak ada data pengeluaran untuk bulan yang dipilih.")
+        return None
+    
+    day_labels = "['Sen', 'Sel', 'Rab', 'Kam', 'Jum', 'Sab', 'Min'][datum.value]"
+    
+    heatmap = alt.Chart(df_calendar).mark_rect(stroke='white', strokeWidth=1).encode(
+        x=alt.X('week:O', title='Minggu ke-', 
+                axis=alt.Axis(labels=True, ticks=True, domain=False, labelAngle=0)),
+        y=alt.Y('weekday:O', title='Hari', 
+                axis=alt.Axis(labelExpr=day_labels, domain=False, ticks=False)),
+        color=alt.Color('Jumlah:Q', title='Pengeluaran (Rp)', 
+                       scale=alt.Scale(scheme='reds'), 
+                       legend=alt.Legend(direction='horizontal', orient='bottom')),
+        tooltip=[
+            alt.Tooltip('Tanggal:T', format='%A, %d %B %Y', title='Tanggal'),
+            alt.Tooltip('Jumlah:Q', format=',.0f', title='Total Pengeluaran')
+        ]
+    ).properties(
+        title=alt.TitleParams(
+            text=f"Peta Panas Pengeluaran Bulan {year_month}",
+            fontSize=16,
+            fontWeight="bold"
+        ),
+        height=250
+    )
+    
+    text = heatmap.mark_text(baseline='middle', fontSize=11, fontWeight='bold').encode(
+        text='day:O',
+        color=alt.condition(
+            alt.datum.Jumlah > df_calendar['Jumlah'].quantile(0.75),
+            alt.value('white'),
+            alt.value('black')
+        )
+    )
+    
+    return heatmap + text
+
+def create_year_heatmap(df_calendar, title, by_year=False):
+    """Membuat heatmap pengeluaran harian untuk rentang panjang (12 bulan / multi-tahun)."""
+    if df_calendar.empty or df_calendar['Jumlah'].sum() == 0:
+        st.info("Tidak ada data pengeluaran untuk periode yang dipilih.")
+        return None
+    
+    # Kolom minggu dihitung dari Senin pertama tiap baris (per tahun atau seluruh rentang)
+    df_plot = df_calendar[['Tanggal', 'Jumlah', 'Tahun', 'weekday']].copy()
+    if by_year:
+        group_start = df_plot.groupby('Tahun')['Tanggal'].transform('min')
+    else:
+        group_start = pd.Series(df_plot['Tanggal'].min(), index=df_plot.index)
+    first_monday = group_start - pd.to_timedelta(group_start.dt.dayofweek, unit='D')
+    df_plot['week'] = (df_plot['Tanggal'] - first_monday).dt.days // 7
+    
+    day_labels = "['Sen', 'Sel', 'Rab', 'Kam', 'Jum', 'Sab', 'Min'][datum.value]"
+    
+    heatmap = alt.Chart(df_plot).mark_rect(stroke='white', strokeWidth=1).encode(
+        x=alt.X('week:O', title='Minggu ke-',
+                axis=alt.Axis(labels=False, ticks=False, domain=False)),
+        y=alt.Y('weekday:O', title=None,
+                axis=alt.Axis(labelExpr=day_labels, domain=False, ticks=False)),
+        color=alt.Color('Jumlah:Q', title='Pengeluaran (Rp)',
+                       scale=alt.Scale(scheme='reds'),
+                       legend=alt.Legend(direction='horizontal', orient='bottom')),
+        tooltip=[
+            alt.Tooltip('Tanggal:T', format='%A, %d %B %Y', title='Tanggal'),
+            alt.Tooltip('Jumlah:Q', format=',.0f', title='Total Pengeluaran')
+        ]
+    ).properties(height=140)
+    
+    if by_year:
+        heatmap = heatmap.facet(row=alt.Row('Tahun:O', title=None))
+    
+    return heatmap.properties(
+        title=alt.TitleParams(text=title, fontSize=16, fontWeight="bold")
+    )
+
+def create_sankey_chart(df, title):
+    """Membuat Sankey Diagram aliran dana."""
+    df_pemasukan = df[df['Tipe'] == 'Pemasukan']
+    df_pengeluaran = df[df['Tipe'] == 'Pengeluaran']
+    
+    if df_pemasukan.empty or df_pengeluaran.empty:
+        return None
+
+    labels = []
+    sumber_pemasukan = df_pemasukan['Kategori'].unique().tolist()
+    labels.extend(sumber_pemasukan)
+    
+    node_total_pemasukan_idx = len(labels)
+    labels.append("TOTAL PEMASUKAN")
+    
+    node_total_pengeluaran_idx = len(labels)
+    labels.append("TOTAL PENGELUARAN")
+
+    kategori_pengeluaran = df_pengeluaran['Kategori'].unique().tolist()
+    labels.extend(kategori_pengeluaran)
+    
+    label_to_idx = {label: i for i, label in enumerate(labels)}
+    
+    source_nodes = []
+    target_nodes = []
+    values = []
+    colors = []
+    
+    df_agg_pemasukan = df_pemasukan.groupby('Kategori')['Jumlah'].sum()
+    for kategori, jumlah in df_agg_pemasukan.items():
+        source_nodes.append(label_to_idx[kategori])
+        target_nodes.append(node_total_pemasukan_idx)
+        values.append(jumlah)
+        colors.append("rgba(0, 200, 83, 0.8)")
+        
+    total_pemasukan = df_agg_pemasukan.sum()
+    total_pengeluaran = df_pengeluaran['Jumlah'].sum()
+    
+    if total_pengeluaran > 0:
+        source_nodes.append(node_total_pemasukan_idx)
+        target_nodes.append(node_total_pengeluaran_idx)
+        values.append(total_pengeluaran)
+        colors.append("rgba(255, 193, 7, 0.8)")
+
+    df_agg_pengeluaran = df_pengeluaran.groupby('Kategori')['Jumlah'].sum()
+    for kategori, jumlah in df_agg_pengeluaran.items():
+        source_nodes.append(node_total_pengeluaran_idx)
+        target_nodes.append(label_to_idx[kategori])
+        values.append(jumlah)
+        colors.append("rgba(244, 67, 54, 0.8)")
+
+    sisa = total_pemasukan - total_pengeluaran
+    if sisa > 0:
+        node_tabungan_idx = len(labels)
+        labels.append("💎 TABUNGAN")
+        
+        source_nodes.append(node_total_pemasukan_idx)
+        target_nodes.append(node_tabungan_idx)
+        values.append(sisa)
+        colors.append("rgba(33, 150, 243, 0.8)")
+
+    # Plotly berat untuk di-import; hanya dibutuhkan di view Sankey
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Sankey(
+        arrangement="snap",
+        node=dict(
+            pad=25,
+            thickness=25,
+            line=dict(color="black", width=1),
+            label=labels,
+            color="rgba(100, 126, 234, 0.8)",
+            hovertemplate='%{label}: Rp%{value:.0f}<extra></extra>'
+        ),
+        link=dict(
+            source=source_nodes,
+            target=target_nodes,
+            value=values,
+            color=colors,
+            hovertemplate='Dana mengalir: Rp%{value:.0f}<extra></extra>'
+        )
+    )])
+    
+    fig.update_layout(
+        title_text=f"<b>{title}</b>",
+        font_size=12,
+        height=500,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    return fig
+
+def create_monthly_trend_chart(df):
+    """Membuat chart trend bulanan."""
+    bulan = df['Tanggal'].dt.to_period('M').astype(str).rename('Bulan')
+    
+    monthly_summary = df.groupby([bulan, 'Tipe'])['Jumlah'].sum().unstack(fill_value=0)
+    monthly_summary['Saldo'] = monthly_summary.get('Pemasukan', 0) - monthly_summary.get('Pengeluaran', 0)
+    monthly_summary = monthly_summary.reset_index()
+    
+    base = alt.Chart(monthly_summary).encode(
+        x=alt.X('Bulan:N', title='Bulan', axis=alt.Axis(labelAngle=-45))
+    )
+    
+    bars_pemasukan = base.mark_bar(size=25).encode(
+        y=alt.Y('Pemasukan:Q', title='Jumlah (Rp)'),
+        color=alt.value('#4CAF50'),
+        tooltip=['Bulan', alt.Tooltip('Pemasukan:Q', format=',.0f', title='Pemasukan')]
+    )
+    
+    bars_pengeluaran = base.mark_bar(size=25).encode(
+        y=alt.Y('Pengeluaran:Q'),
+        color=alt.value('#F44336'),
+        tooltip=['Bulan', alt.Tooltip('Pengeluaran:Q', format=',.0f', title='Pengeluaran')]
+    )
+    
+    line_saldo = base.mark_line(point=True, strokeWidth=3).encode(
+        y=alt.Y('Saldo:Q', title='Saldo'),
+        color=alt.value('#2196F3'),
+        tooltip=['Bulan', alt.Tooltip('Saldo:Q', format=',.0f', title='Saldo')]
+    )
+    
+    return alt.layer(bars_pemasukan, bars_pengeluaran, line_saldo).resolve_scale(
+        y='independent'
+    ).properties(
+        title="Trend Bulanan - Pemasukan, Pengeluaran & Saldo",
+        height=350
+    )
+
+def create_daily_net_chart(daily_net, df_rolling=None):
+    """Bar chart net flow harian (hijau surplus, merah defisit), opsional dengan garis rata-rata bergulir."""
+    bars = alt.Chart(daily_net).mark_bar(size=20).encode(
+        x=alt.X('Tanggal:T', title='Tanggal', axis=alt.Axis(format="%d %b")),
+        y=alt.Y('Net:Q', title='Net Flow (Rp)'),
+        color=alt.condition(
+            alt.datum.Net > 0,
+            alt.value('#4CAF50'),
+            alt.value('#F44336')
+        ),
+        tooltip=[
+            alt.Tooltip('Tanggal:T', format='%A, %d %B %Y'),
+            alt.Tooltip('Net:Q', format=',.0f', title='Net Flow')
+        ]
+    ).properties(height=300)
+    if df_rolling is None or df_rolling.empty:
+        return bars
+    
+    lines = alt.Chart(df_rolling).mark_line(strokeWidth=2).encode(
+        x='Tanggal:T',
+        y='Net:Q',
+        stroke=alt.Stroke('Jendela:N', title='Rata-rata bergulir',
+                          scale=alt.Scale(range=['#2196F3', '#9C27B0', '#FF9800'])),
+        tooltip=[
+            alt.Tooltip('Tanggal:T', format='%d %B %Y'),
+            'Jendela:N',
+            alt.Tooltip('Net:Q', format=',.0f', title='Net Flow/hari'),
+            alt.Tooltip('Pengeluaran:Q', format=',.0f', title='Pengeluaran/hari')
+        ]
+    )
+    return alt.layer(bars, lines)
+
+def create_cumulative_chart(df_cumulative):
+    """Area chart saldo kumulatif."""
+    return alt.Chart(df_cumulative).mark_area(
+        line={'color': '#2196F3'},
+        color=alt.Gradient(
+            gradient='linear',
+            stops=[alt.GradientStop(color='#2196F3', offset=0),
+                  alt.GradientStop(color='rgba(33, 150, 243, 0.1)', offset=1)],
+            x1=0, x2=0, y1=1, y2=0
+        )
+    ).encode(
+        x=alt.X('Tanggal:T', title='Tanggal'),
+        y=alt.Y('Saldo Kumulatif:Q', title='Saldo (Rp)'),
+        tooltip=['Tanggal:T', 'Saldo Kumulatif:Q']
+    ).properties(height=300)
+
+def create_projection_chart(bands, target):
+    """Pita persentil proyeksi saldo (P5–P95 & P25–P75), garis median dan garis target."""
+    base = alt.Chart(bands).encode(
+        x=alt.X('Bulan:T', title='Bulan', axis=alt.Axis(format="%b %Y"))
+    )
+    outer = base.mark_area(opacity=0.2, color='#2196F3').encode(
+        y=alt.Y('P5:Q', title='Proyeksi Saldo (Rp)'),
+        y2='P95:Q'
+    )
+    inner = base.mark_area(opacity=0.35, color='#2196F3').encode(y='P25:Q', y2='P75:Q')
+    median = base.mark_line(color='#0D47A1', point=True).encode(
+        y='P50:Q',
+        tooltip=[
+            alt.Tooltip('Bulan:T', format='%B %Y'),
+            alt.Tooltip('P5:Q', format=',.0f', title='Pesimis (P5)'),
+            alt.Tooltip('P50:Q', format=',.0f', title='Median'),
+            alt.Tooltip('P95:Q', format=',.0f', title='Optimis (P95)'),
+            alt.Tooltip('Peluang Target:Q', format='.0%', title='Peluang capai target')
+        ]
+    )
+    target_rule = alt.Chart(pd.DataFrame({'Target': [target]})).mark_rule(
+        color='#F44336', strokeDash=[6, 4]
+    ).encode(y='Target:Q')
+    return alt.layer(outer, inner, median, target_rule).properties(height=350)
+
+def create_budget_chart(budget_vs_actual):
+    """Bar chart perbandingan budget vs actual per kategori."""
+    budget_chart_data = budget_vs_actual.melt(
+        id_vars=['Kategori', 'Status'],
+        value_vars=['Budget', 'Actual'],
+        var_name='Type',
+        value_name='Amount'
+    )
+    
+    return alt.Chart(budget_chart_data).mark_bar().encode(
+        x=alt.X('Kategori:N', title='Kategori'),
+        y=alt.Y('Amount:Q', title='Jumlah (Rp)'),
+        color=alt.Color('Type:N', scale=alt.Scale(
+            domain=['Budget', 'Actual'],
+            range=['#4CAF50', '#FF9800']
+        )),
+        column='Type:N',
+        tooltip=['Kategori', 'Type', alt.Tooltip('Amount', format=',.0f')]
+    ).properties(
+        title='Perbandingan Budget vs Actual Spending',
+        height=300
+    )
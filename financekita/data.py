@@ -0,0 +1,693 @@
+"""Akses data: koneksi Google Sheets, snapshot ledger bersama, arsip bulanan & kurs."""
+
+import contextlib
+import gzip
+import json
+import os
+import sys
+import threading
+from collections import namedtuple
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from financekita import rules, sharedcache
+
+
+# --- ====================================================== ---
+# ---                 KONEKSI GOOGLE SHEETS                 ---
+# --- ====================================================== ---
+
+@st.cache_resource(show_spinner=False)
+def connect_worksheet(credentials, spreadsheet_url, worksheet_name):
+    """Membuka worksheet sekali per proses; gspread baru di-import saat koneksi pertama."""
+    import gspread
+    
+    gc = gspread.service_account_from_dict(credentials)
+    return gc.open_by_url(spreadsheet_url).worksheet(worksheet_name)
+
+# --- ====================================================== ---
+# ---              FUNGSI UTILITAS & CACHING               ---
+# --- ====================================================== ---
+
+def get_data_hash():
+    """Generate hash berdasarkan timestamp untuk cache invalidation."""
+    return datetime.now().strftime("%Y%m%d%H")
+
+DEFAULT_BUDGET_SETTINGS = {
+    "Makanan": 1000000,
+    "Transportasi": 500000,
+    "Hiburan": 300000,
+    "Belanja": 800000
+}
+
+# Direktori cache lintas proses (file Arrow di disk lokal) untuk beberapa replika
+# server; kosong = snapshot hanya dibagi antar sesi dalam satu proses
+SHARED_CACHE_DIR = os.environ.get("FINANCEKITA_SHARED_CACHE_DIR")
+
+# Batas memori data milik satu sesi (arsip yang dibuka, dsb.); data bersama tidak dihitung
+SESSION_MEMORY_BUDGET_MB = float(os.environ.get("FINANCEKITA_SESSION_MEMORY_MB", 32))
+
+# Satu revisi data yang diterbitkan utuh (satu assignment), sehingga pembaca
+# tidak pernah melihat frame live dan harian dari revisi yang berbeda.
+# source: "sheets" (fetch), "rules" (kategori ulang tanpa fetch) atau "disk" (map dari replika lain)
+LedgerSnapshot = namedtuple(
+    "LedgerSnapshot", ["revision", "key", "live", "daily", "last_refresh", "derived", "source"]
+)
+
+@st.cache_resource
+def shared_ledger():
+    """Snapshot ledger satu proses yang dipakai bersama oleh semua sesi.
+    
+    Frame di sini read-only: sesi hanya boleh membuat view/slice atau hasil
+    agregasi baru, tidak pernah mengubah kolom di tempat.
+    """
+    return {
+        "lock": threading.Lock(),
+        "snapshot": LedgerSnapshot(0, None, None, None, None, {}, None),
+        "anomaly_states": None,
+        "anomaly_revision": None,
+        "anomalies": None,
+        "rolling_state": None,
+        "rolling_revision": None,
+        # Frame live & penanda arsip yang sudah tercermin di rolling_state
+        "rolling_live": None,
+        "rolling_archive": None,
+        "anomaly_archive": None,
+        # State pencocokan aturan kategori untuk baris live tanpa Kategori
+        "rules_state": None,
+        # State pencocokan per bulan arsip untuk baris yang dikategorikan otomatis
+        "archive_rules_states": {},
+        "rules_version": None,
+        # Versi tabel kurs (mtime) yang dipakai mengonversi frame live snapshot
+        "fx_version": None,
+        # Setelan budget terakhir dari sidebar, dipakai API ringkasan
+        "budget_settings": dict(DEFAULT_BUDGET_SETTINGS),
+    }
+
+def invalidate_shared_ledger():
+    """Menandai snapshot bersama kedaluwarsa; load berikutnya mengambil ulang dari Sheets."""
+    shared = shared_ledger()
+    shared["snapshot"] = shared["snapshot"]._replace(key=None)
+    if SHARED_CACHE_DIR:
+        # Replika lain ikut melihat snapshot di disk kedaluwarsa
+        sharedcache.invalidate(SHARED_CACHE_DIR)
+
+def _snapshot_stale(shared):
+    """Snapshot perlu dibangun ulang: data kedaluwarsa, aturan kategori/kurs berubah, atau revisi baru di disk."""
+    snapshot = shared["snapshot"]
+    if (snapshot.live is None or snapshot.key != get_data_hash()
+            or shared["rules_version"] != category_rules_version()
+            or shared["fx_version"] != fx_rates_version()):
+        return True
+    if SHARED_CACHE_DIR:
+        manifest = sharedcache.read_manifest(SHARED_CACHE_DIR)
+        return not _disk_snapshot_usable(manifest) or manifest["revision"] != snapshot.revision
+    return False
+
+def _disk_snapshot_usable(manifest):
+    """Snapshot di disk masih berlaku untuk jam data, versi aturan & versi kurs saat ini."""
+    return (manifest is not None and manifest.get("valid", True)
+            and manifest["key"] == get_data_hash()
+            and manifest["rules_version"] == category_rules_version()
+            and manifest.get("fx_version") == fx_rates_version())
+
+def _only_rules_changed(shared, manifest=None):
+    """Snapshot basi hanya karena versi aturan kategori; baris live masih sama dengan Sheets.
+    
+    Dengan cache lintas proses, manifest di disk juga harus masih berlaku dan
+    berasal dari revisi yang dibangun proses ini sendiri (state aturan cocok
+    dengan frame live-nya); manifest yang di-invalidate atau lebih baru selalu
+    memicu fetch ulang.
+    """
+    snapshot = shared["snapshot"]
+    if (snapshot.live is None or snapshot.key != get_data_hash()
+            or shared["rules_state"] is None or snapshot.source == "disk"
+            or shared["rules_version"] == category_rules_version()
+            or shared["fx_version"] != fx_rates_version()):
+        return False
+    if SHARED_CACHE_DIR:
+        return (manifest is not None and manifest.get("valid", True)
+                and manifest["key"] == snapshot.key and manifest["revision"] == snapshot.revision)
+    return True
+
+def _rebuild_snapshot(shared, ws, revision, recategorize=False):
+    """Mengambil baris live dari Sheets (atau hanya mengkategorikan ulang) lalu menerbitkan ``revision``."""
+    if recategorize:
+        # Hanya aturan kategori yang berubah: kategorikan ulang tanpa fetch
+        df = apply_category_rules(shared["snapshot"].live, recheck=True)
+    else:
+        # Hanya baris yang belum diarsip yang diambil dan di-parse.
+        shared["fx_version"] = fx_rates_version()
+        df = load_live_rows(ws)
+    # Kategori otomatis di arsip ikut dinilai ulang bila aturan berubah
+    manifest = recategorize_archive()
+    df_daily = pd.concat([load_rollup_daily(manifest), summarize_daily(df)], ignore_index=True)
+    # Urut tanggal supaya filter rentang cukup berupa slice (view)
+    df_daily = df_daily.sort_values('Tanggal', kind='stable', ignore_index=True)
+    
+    shared["snapshot"] = LedgerSnapshot(
+        revision=revision,
+        key=get_data_hash(),
+        live=df,
+        daily=df_daily,
+        last_refresh=datetime.now(),
+        derived={},
+        source="rules" if recategorize else "sheets",
+    )
+
+def _refresh_from_shared_cache(shared, ws):
+    """Memetakan snapshot terbaru dari disk; hanya replika yang mendapati revisi basi yang fetch."""
+    manifest = sharedcache.read_manifest(SHARED_CACHE_DIR)
+    if not _disk_snapshot_usable(manifest):
+        with sharedcache.refresh_lock(SHARED_CACHE_DIR):
+            # Replika lain mungkin sudah mengambil ulang saat kita menunggu lock
+            manifest = sharedcache.read_manifest(SHARED_CACHE_DIR)
+            if not _disk_snapshot_usable(manifest):
+                revision = max(manifest["revision"] if manifest else 0, shared["snapshot"].revision) + 1
+                _rebuild_snapshot(shared, ws, revision, _only_rules_changed(shared, manifest))
+                snapshot = shared["snapshot"]
+                sharedcache.write_snapshot(
+                    SHARED_CACHE_DIR, revision,
+                    {"live": snapshot.live, "daily": snapshot.daily},
+                    key=snapshot.key, rules_version=shared["rules_version"],
+                    fx_version=shared["fx_version"],
+                )
+                return
+    
+    if manifest["revision"] != shared["snapshot"].revision:
+        frames = sharedcache.map_snapshot(SHARED_CACHE_DIR, manifest)
+        shared["rules_version"] = manifest["rules_version"]
+        shared["fx_version"] = manifest.get("fx_version")
+        shared["snapshot"] = LedgerSnapshot(
+            revision=manifest["revision"],
+            key=manifest["key"],
+            live=frames["live"],
+            daily=frames["daily"],
+            last_refresh=datetime.now(),
+            derived={},
+            source="disk",
+        )
+
+# Cache data dengan cara yang compatible
+def load_data_with_cache(ws, cache_key=None):
+    """Membaca data dengan caching yang aman.
+    
+    Mengembalikan ``LedgerSnapshot`` utuh: ``live`` (detail transaksi yang
+    belum diarsip) dan ``daily`` (total harian seluruh riwayat) selalu dari
+    revisi yang sama.
+    """
+    shared = shared_ledger()
+    try:
+        # Snapshot bersama masih berlaku: pakai tanpa menyalin
+        if _snapshot_stale(shared):
+            with shared["lock"]:
+                # Sesi lain mungkin sudah memuat ulang saat kita menunggu lock
+                if _snapshot_stale(shared):
+                    if SHARED_CACHE_DIR:
+                        _refresh_from_shared_cache(shared, ws)
+                    else:
+                        _rebuild_snapshot(shared, ws, shared["snapshot"].revision + 1,
+                                          _only_rules_changed(shared))
+        
+        # Dibaca sekali: sesi lain boleh menerbitkan revisi baru setelah ini
+        snapshot = shared["snapshot"]
+        st.session_state.data_revision = snapshot.revision
+        st.session_state.cache_key = snapshot.key
+        st.session_state.last_refresh = snapshot.last_refresh
+        return snapshot
+        
+    except Exception as e:
+        st.error(f"Gagal membaca data: {e}")
+        df_empty = pd.DataFrame(columns=LEDGER_COLUMNS)
+        return LedgerSnapshot(st.session_state.get('data_revision', 0), None, df_empty,
+                              summarize_daily(df_empty), None, {}, None)
+
+def cached_per_revision(name, builder, *args, params=()):
+    """Memoize hasil turunan data per revisi data (dan parameter tambahan), dibagi antar sesi."""
+    revision = st.session_state.get('data_revision', 0)
+    snapshot = shared_ledger()["snapshot"]
+    cache = snapshot.derived
+    key = (name, revision, params)
+    if key not in cache:
+        # Snapshot baru membawa cache kosong; entri revisi lain tidak pernah dipakai lagi
+        if revision != snapshot.revision:
+            return builder(*args)
+        cache[key] = builder(*args)
+    return cache[key]
+
+def _session_nbytes(obj, skip_ids, seen):
+    """Perkiraan ukuran objek milik sesi (rekursif), tanpa objek bersama."""
+    if id(obj) in seen or id(obj) in skip_ids:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            _session_nbytes(k, skip_ids, seen) + _session_nbytes(v, skip_ids, seen) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(_session_nbytes(item, skip_ids, seen) for item in obj)
+    return sys.getsizeof(obj)
+
+def session_memory_bytes():
+    """Byte yang dipegang session state sesi ini (snapshot bersama tidak dihitung)."""
+    snapshot = shared_ledger()["snapshot"]
+    skip_ids = {id(snapshot.live), id(snapshot.daily)}
+    seen = set()
+    return sum(_session_nbytes(st.session_state[key], skip_ids, seen) for key in st.session_state.keys())
+
+def shared_memory_bytes():
+    """Byte snapshot bersama (frame dasar + cache turunan per revisi)."""
+    shared = shared_ledger()
+    snapshot = shared["snapshot"]
+    return _session_nbytes([snapshot.live, snapshot.daily, snapshot.derived, shared["anomalies"]], set(), set())
+
+def enforce_session_memory_budget():
+    """Membuang arsip bulan yang paling lama tidak dibuka sampai sesi di bawah batas memori."""
+    budget = SESSION_MEMORY_BUDGET_MB * 1024 * 1024
+    archive_cache = st.session_state.get('archive_cache', {})
+    while archive_cache and session_memory_bytes() > budget:
+        archive_cache.pop(next(iter(archive_cache)))
+
+# --- ====================================================== ---
+# ---                 KONVERSI MATA UANG                   ---
+# --- ====================================================== ---
+
+# Semua total, chart dan budget dihitung dalam Rupiah. Transaksi dengan kolom
+# "Mata Uang" lain dikonversi memakai tabel kurs historis lokal (CSV dengan
+# kolom Tanggal, Mata Uang, Kurs = Rupiah per 1 unit mata uang tersebut).
+REPORTING_CURRENCY = "IDR"
+FX_RATES_PATH = Path(os.environ.get("FINANCEKITA_FX_RATES", "fx_rates.csv"))
+
+@st.cache_data(show_spinner=False)
+def _read_fx_rates(path, mtime):
+    """Membaca tabel kurs; ``mtime`` ikut jadi kunci cache agar file baru terbaca ulang."""
+    rates = pd.read_csv(path)
+    rates['Tanggal'] = pd.to_datetime(rates['Tanggal']).astype('datetime64[ns]')
+    rates['Mata Uang'] = rates['Mata Uang'].astype(str).str.strip().str.upper()
+    rates['Kurs'] = pd.to_numeric(rates['Kurs'], errors='coerce')
+    return rates.dropna(subset=['Kurs']).sort_values('Tanggal', ignore_index=True)
+
+def fx_rates_version():
+    """Penanda versi tabel kurs (mtime), ``None`` bila file belum ada."""
+    return FX_RATES_PATH.stat().st_mtime if FX_RATES_PATH.exists() else None
+
+def load_fx_rates():
+    """Tabel kurs historis lokal, atau frame kosong bila file belum ada."""
+    version = fx_rates_version()
+    if version is None:
+        return pd.DataFrame({
+            'Tanggal': pd.Series(dtype='datetime64[ns]'),
+            'Mata Uang': pd.Series(dtype=object),
+            'Kurs': pd.Series(dtype='float64'),
+        })
+    return _read_fx_rates(str(FX_RATES_PATH), version)
+
+def convert_to_reporting_currency(df):
+    """Konversi "Jumlah" ke Rupiah dengan satu as-of join tanggal pada tabel kurs.
+    
+    Kurs yang dipakai adalah kurs terakhir pada atau sebelum tanggal transaksi;
+    transaksi sebelum awal tabel memakai kurs paling awal. Nilai asli disimpan
+    di kolom "Jumlah Asli". Mata uang tanpa kurs mendapat "Jumlah" NaN; baris
+    itu tidak ditampilkan dan tidak diarsip sampai kursnya ditambahkan.
+    """
+    df = df.copy()
+    currency = df['Mata Uang'].fillna('').astype(str).str.strip().str.upper()
+    df['Mata Uang'] = currency.mask(currency == '', REPORTING_CURRENCY)
+    df['Jumlah Asli'] = df['Jumlah']
+    
+    foreign = (df['Mata Uang'] != REPORTING_CURRENCY).to_numpy()
+    if not foreign.any():
+        return df
+    
+    left = pd.DataFrame({
+        'Tanggal': df['Tanggal'].to_numpy()[foreign].astype('datetime64[ns]'),
+        'Mata Uang': df['Mata Uang'].to_numpy()[foreign],
+        '_pos': np.flatnonzero(foreign),
+    }).sort_values('Tanggal', kind='stable')
+    rates = load_fx_rates()
+    
+    joined = pd.merge_asof(left, rates, on='Tanggal', by='Mata Uang', direction='backward')
+    if joined['Kurs'].isna().any():
+        nearest = pd.merge_asof(left, rates, on='Tanggal', by='Mata Uang', direction='nearest')
+        joined['Kurs'] = joined['Kurs'].fillna(nearest['Kurs'])
+    
+    kurs = np.ones(len(df))
+    kurs[joined['_pos'].to_numpy()] = joined['Kurs'].to_numpy()
+    missing = np.isnan(kurs)
+    if missing.any():
+        unknown = sorted(df['Mata Uang'].to_numpy()[missing].astype(str))
+        st.warning(
+            f"⚠️ {missing.sum()} transaksi belum ditampilkan: kurs untuk {', '.join(dict.fromkeys(unknown))} "
+            f"tidak ada di {FX_RATES_PATH}."
+        )
+    
+    df['Jumlah'] = df['Jumlah'].to_numpy() * kurs
+    return df
+
+# --- ====================================================== ---
+# ---               AUTO-KATEGORI DARI CATATAN              ---
+# --- ====================================================== ---
+
+# Aturan buatan pengguna: CSV lokal dengan kolom "Kata Kunci", "Kategori".
+# Baris tanpa Kategori (mis. mutasi rekening yang diimpor) dikategorikan
+# otomatis dari Catatan; yang tidak cocok dengan aturan mana pun jadi "Lainnya".
+CATEGORY_RULES_PATH = Path(os.environ.get("FINANCEKITA_CATEGORY_RULES", "kategori_rules.csv"))
+UNCATEGORIZED = "Lainnya"
+
+def category_rules_version():
+    """Penanda versi file aturan (mtime), ``None`` bila file belum ada."""
+    return CATEGORY_RULES_PATH.stat().st_mtime if CATEGORY_RULES_PATH.exists() else None
+
+@st.cache_data(show_spinner=False)
+def _read_category_rules(path, mtime):
+    """Membaca aturan; ``mtime`` ikut jadi kunci cache agar file baru terbaca ulang."""
+    return rules.normalize_rules(pd.read_csv(path, dtype=str))
+
+def load_category_rules():
+    """Aturan ``{kata kunci: kategori}``, atau dict kosong bila file belum ada."""
+    version = category_rules_version()
+    return {} if version is None else _read_category_rules(str(CATEGORY_RULES_PATH), version)
+
+def _uncategorized(df):
+    """Mask baris tanpa Kategori (kosong atau hanya spasi)."""
+    return (df['Kategori'].isna() | (df['Kategori'].astype(str).str.strip() == '')).to_numpy()
+
+def apply_category_rules(df, recheck=False):
+    """Mengisi Kategori baris tanpa kategori dari Catatan; frame input tidak diubah.
+    
+    Baris yang dinilai diingat di snapshot bersama, sehingga saat aturan
+    bertambah hanya aturan baru yang dipindai terhadap baris lama.
+    ``recheck=True`` menilai ulang baris yang sebelumnya dikategorikan
+    otomatis pada frame yang sudah diproses (tanpa fetch ulang).
+    """
+    shared = shared_ledger()
+    state = shared["rules_state"]
+    if recheck:
+        auto = df.index.isin(state["notes"].index) if state is not None else np.zeros(len(df), dtype=bool)
+    else:
+        auto = _uncategorized(df)
+    
+    categories, shared["rules_state"] = rules.categorize(
+        df.loc[auto, 'Catatan'], load_category_rules(), state
+    )
+    shared["rules_version"] = category_rules_version()
+    if not auto.any():
+        return df
+    kategori = df['Kategori'].copy()
+    kategori[auto] = categories.fillna(UNCATEGORIZED).to_numpy()
+    return df.assign(Kategori=kategori)
+
+# --- ====================================================== ---
+# ---            ARSIP BULANAN (ROLLUP PARTITION)           ---
+# --- ====================================================== ---
+
+TRANSACTION_COLUMNS = ["Tanggal", "Tipe", "Kategori", "Jumlah", "Catatan"]
+# Kolom detail setelah parsing: "Jumlah" selalu dalam mata uang laporan (Rp)
+LEDGER_COLUMNS = TRANSACTION_COLUMNS + ["Mata Uang", "Jumlah Asli"]
+# Arsip mentah juga mencatat baris mana yang Kategori-nya hasil aturan, supaya
+# bisa dinilai ulang saat aturan berubah
+AUTO_CATEGORY_COLUMN = "Kategori Otomatis"
+DAILY_COLUMNS = ["Tanggal", "Tipe", "Kategori", "Jumlah", "Transaksi"]
+
+# Bulan berjalan (dan bulan sebelumnya, untuk transaksi susulan) tetap live.
+# Bulan yang lebih lama dipadatkan menjadi rollup di disk. File bulan ditulis
+# dengan nomor versi di namanya dan baru terlihat lewat penggantian manifest
+# yang atomik, sehingga penulisan yang gagal di tengah jalan tidak pernah
+# terbaca dan bisa diulang tanpa menggandakan baris.
+LIVE_MONTHS = 2
+ROLLUP_DIR = Path(os.environ.get("FINANCEKITA_ROLLUP_DIR", ".financekita_rollups"))
+
+@st.cache_resource
+def _rollup_lock():
+    """Lock proses untuk mencegah dua sesi memadatkan arsip bersamaan."""
+    return threading.Lock()
+
+@contextlib.contextmanager
+def _locked_rollups():
+    """Lock antar sesi & antar proses server selama arsip diubah."""
+    with _rollup_lock(), sharedcache.file_lock(ROLLUP_DIR / "rollup.lock"):
+        yield
+
+def parse_transactions(df):
+    """Normalisasi kolom transaksi mentah dari Google Sheets dan konversi ke Rupiah."""
+    for col in TRANSACTION_COLUMNS + ["Mata Uang"]:
+        if col not in df.columns:
+            df[col] = None
+    
+    df['Tanggal'] = pd.to_datetime(df['Tanggal'], errors='coerce')
+    df['Jumlah'] = pd.to_numeric(df['Jumlah'], errors='coerce').fillna(0)
+    df.dropna(subset=['Tanggal'], inplace=True)
+    return convert_to_reporting_currency(df[df['Jumlah'] > 0])
+
+def summarize_daily(df):
+    """Meringkas transaksi menjadi total harian per Tipe & Kategori."""
+    if df.empty:
+        return pd.DataFrame(columns=DAILY_COLUMNS).astype({'Tanggal': 'datetime64[ns]', 'Jumlah': 'float64', 'Transaksi': 'int64'})
+    
+    return df.groupby(
+        [df['Tanggal'].dt.normalize(), 'Tipe', 'Kategori'], dropna=False
+    )['Jumlah'].agg(Jumlah='sum', Transaksi='count').reset_index()
+
+def _empty_rollup_manifest(version=0, generation=0):
+    return {"rows_archived": 0, "header": TRANSACTION_COLUMNS, "months": {},
+            "version": version, "generation": generation}
+
+def read_rollup_manifest():
+    """Membaca manifest arsip: jumlah baris sheet yang sudah diarsip, baris terakhirnya & versi tiap bulan.
+    
+    ``months`` memetakan bulan ke versi file-nya; ``generation`` naik setiap
+    arsip dibangun ulang dari awal.
+    """
+    path = ROLLUP_DIR / "manifest.json"
+    if not path.exists():
+        return _empty_rollup_manifest()
+    manifest = json.loads(path.read_text())
+    if isinstance(manifest["months"], list):
+        # Manifest lama: file bulan tanpa nomor versi
+        manifest["months"] = dict.fromkeys(manifest["months"])
+    return manifest
+
+def _write_rollup_manifest(manifest):
+    ROLLUP_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = ROLLUP_DIR / "manifest.json.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, ROLLUP_DIR / "manifest.json")
+
+def _row_fingerprint(row):
+    """Isi baris sheet tanpa sel kosong di ujung (Sheets API tidak mengembalikannya)."""
+    row = [str(cell) for cell in row]
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+def _month_path(year_month, version, kind):
+    """Path file arsip bulan (``kind`` "raw" atau "daily") untuk versi tertentu."""
+    suffix = "raw.csv.gz" if kind == "raw" else "daily.csv"
+    if version is None:
+        return ROLLUP_DIR / f"{year_month}.{suffix}"
+    return ROLLUP_DIR / f"{year_month}.v{version:06d}.{suffix}"
+
+def _publish_months(manifest, frames, **changes):
+    """Menulis arsip baru untuk bulan di ``frames`` lalu menerbitkannya lewat manifest.
+    
+    Harus dipanggil di dalam ``_locked_rollups``. Versi sebelumnya tiap bulan
+    disimpan untuk pembaca yang masih memegang manifest lama; versi yang
+    lebih tua (atau sisa penulisan yang gagal) dihapus.
+    """
+    ROLLUP_DIR.mkdir(parents=True, exist_ok=True)
+    version = manifest.get("version", 0) + 1
+    for year_month, df_month in frames.items():
+        with gzip.open(_month_path(year_month, version, "raw"), "wt", encoding="utf-8", newline="") as f:
+            df_month.to_csv(f, index=False, date_format="%Y-%m-%d")
+        summarize_daily(df_month).to_csv(_month_path(year_month, version, "daily"), index=False,
+                                         date_format="%Y-%m-%d")
+    
+    previous = manifest["months"]
+    new_manifest = dict(manifest, **changes, version=version,
+                        months=dict(sorted({**previous, **dict.fromkeys(frames, version)}.items())))
+    _write_rollup_manifest(new_manifest)
+    
+    for year_month in frames:
+        keep = {_month_path(year_month, version, kind).name for kind in ("raw", "daily")}
+        if year_month in previous:
+            keep |= {_month_path(year_month, previous[year_month], kind).name for kind in ("raw", "daily")}
+        for path in ROLLUP_DIR.glob(f"{year_month}.*"):
+            if path.name not in keep:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+    return new_manifest
+
+def _reset_rollups():
+    """Menghapus seluruh arsip; baris sheet diambil & dipadatkan ulang dari awal."""
+    with _locked_rollups():
+        previous = read_rollup_manifest()
+        manifest = _empty_rollup_manifest(previous.get("version", 0) + 1, previous.get("generation", 0) + 1)
+        _write_rollup_manifest(manifest)
+        for path in ROLLUP_DIR.glob("*.csv*"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+    return manifest
+
+def load_rollup_daily(manifest=None):
+    """Membaca total harian per kategori dari semua bulan yang sudah ditutup."""
+    months = (manifest or read_rollup_manifest())["months"]
+    if not months:
+        return summarize_daily(pd.DataFrame(columns=TRANSACTION_COLUMNS))
+    
+    frames = [pd.read_csv(_month_path(month, version, "daily"), parse_dates=['Tanggal'])
+              for month, version in months.items()]
+    return pd.concat(frames, ignore_index=True)
+
+def _read_archived_raw(year_month, version):
+    """Baris mentah satu bulan arsip beserta kolom ``AUTO_CATEGORY_COLUMN``."""
+    path = _month_path(year_month, version, "raw")
+    df = pd.read_csv(path, parse_dates=['Tanggal'], keep_default_na=False, na_values={'Jumlah': ['']},
+                     dtype={AUTO_CATEGORY_COLUMN: bool})
+    # Arsip lama (sebelum multi-currency) belum punya kolom mata uang
+    if 'Mata Uang' not in df.columns:
+        df['Mata Uang'] = REPORTING_CURRENCY
+        df['Jumlah Asli'] = df['Jumlah']
+    # Arsip lama tanpa penanda: hanya baris "Lainnya" yang dianggap hasil aturan
+    if AUTO_CATEGORY_COLUMN not in df.columns:
+        df[AUTO_CATEGORY_COLUMN] = df['Kategori'] == UNCATEGORIZED
+    return df[LEDGER_COLUMNS + [AUTO_CATEGORY_COLUMN]]
+
+def load_archived_month(year_month, manifest=None):
+    """Membuka arsip baris mentah untuk satu bulan yang sudah ditutup."""
+    months = (manifest or read_rollup_manifest())["months"]
+    if year_month not in months:
+        return pd.DataFrame(columns=LEDGER_COLUMNS)
+    return _read_archived_raw(year_month, months[year_month])[LEDGER_COLUMNS]
+
+def recategorize_archive():
+    """Menilai ulang baris arsip berkategori otomatis bila aturan berubah sejak penilaian terakhir.
+    
+    Pencocokan inkremental per bulan (state disimpan di snapshot bersama):
+    saat aturan hanya bertambah, catatan lama cukup dipindai dengan kata kunci
+    baru. Hanya bulan yang kategorinya berubah yang ditulis ulang (raw &
+    total harian). Mengembalikan manifest terbaru.
+    """
+    version = category_rules_version()
+    manifest = read_rollup_manifest()
+    if not manifest["months"] or manifest.get("rules_version") == version:
+        return manifest
+    
+    category_rules = load_category_rules()
+    states = shared_ledger()["archive_rules_states"]
+    with _locked_rollups():
+        current = read_rollup_manifest()
+        if current.get("rules_version") == version:
+            return current
+        
+        frames = {}
+        for year_month, month_version in current["months"].items():
+            df_month = _read_archived_raw(year_month, month_version)
+            auto = df_month[AUTO_CATEGORY_COLUMN].to_numpy()
+            categories, states[year_month] = rules.categorize(
+                df_month.loc[auto, 'Catatan'], category_rules, states.get(year_month)
+            )
+            kategori = df_month['Kategori'].copy()
+            kategori[auto] = categories.fillna(UNCATEGORIZED).to_numpy()
+            if not kategori.equals(df_month['Kategori']):
+                frames[year_month] = df_month.assign(Kategori=kategori)
+        return _publish_months(current, frames, rules_version=version)
+
+def compact_closed_months(df_tail, raw_rows, manifest):
+    """Memadatkan prefix baris bulan tertutup ke arsip; sisanya dikembalikan sebagai data live.
+    
+    Arsip dicatat sebagai offset baris sheet, sehingga hanya prefix berurutan
+    yang bisa dipadatkan. Transaksi susulan untuk bulan lama yang ditambahkan
+    setelah baris bulan berjalan tetap live sampai prefix-nya ikut tertutup.
+    Isi baris terakhir yang diarsip disimpan di manifest untuk cek integritas.
+    Baris yang kursnya belum ada (Jumlah NaN) menghentikan prefix agar bisa
+    tampil begitu kursnya ditambahkan.
+    """
+    cutoff = pd.Timestamp(date.today().replace(day=1)) - pd.DateOffset(months=LIVE_MONTHS - 1)
+    pending = df_tail['Jumlah'].isna().to_numpy()
+    df_shown = df_tail[~pending]
+    
+    n_raw_rows = len(raw_rows)
+    # Baris yang gagal di-parse tidak pernah tampil, jadi dianggap tertutup
+    raw_closed = np.ones(n_raw_rows, dtype=bool)
+    raw_closed[df_tail['_row'].to_numpy()] = (df_tail['Tanggal'] < cutoff).to_numpy() & ~pending
+    n_prefix = n_raw_rows if raw_closed.all() else int(raw_closed.argmin())
+    
+    if n_prefix == 0:
+        return df_shown.drop(columns=['_row', AUTO_CATEGORY_COLUMN])
+    
+    with _locked_rollups():
+        current = read_rollup_manifest()
+        if current["rows_archived"] != manifest["rows_archived"]:
+            # Sesi/proses lain sudah memadatkan lebih dulu: baris yang kini ada di arsip
+            # (index = nomor baris sheet) tidak boleh ikut terhitung sebagai live
+            if current.get("generation", 0) == manifest.get("generation", 0):
+                df_shown = df_shown[df_shown.index >= current["rows_archived"] + 2]
+            return df_shown.drop(columns=['_row', AUTO_CATEGORY_COLUMN])
+        
+        df_closed = df_shown[df_shown['_row'] < n_prefix].drop(columns='_row')
+        frames = {}
+        for year_month, df_month in df_closed.groupby(df_closed['Tanggal'].dt.strftime('%Y-%m')):
+            if year_month in current["months"]:
+                df_archived = _read_archived_raw(year_month, current["months"][year_month])
+                df_month = pd.concat([df_archived, df_month], ignore_index=True)
+            frames[year_month] = df_month
+        
+        _publish_months(
+            current, frames,
+            header=manifest["header"],
+            rows_archived=current["rows_archived"] + n_prefix,
+            last_row=_row_fingerprint(raw_rows[n_prefix - 1]),
+        )
+    
+    return df_shown[df_shown['_row'] >= n_prefix].drop(columns=['_row', AUTO_CATEGORY_COLUMN])
+
+def load_live_rows(ws):
+    """Mengambil hanya baris sheet yang belum diarsip, lalu memadatkan bulan yang sudah tertutup."""
+    manifest = read_rollup_manifest()
+    rows_archived = manifest["rows_archived"]
+    
+    if rows_archived > 0:
+        # Header (bisa bertambah kolom, mis. "Mata Uang"), baris terakhir arsip & baris
+        # setelah arsip dalam satu request
+        header_range, last_range, rows = ws.batch_get(
+            ["1:1", f"A{rows_archived + 1}:Z{rows_archived + 1}", f"A{rows_archived + 2}:Z"]
+        )
+        header = header_range[0] if header_range else manifest["header"]
+        last_row = _row_fingerprint(last_range[0][:len(header)]) if last_range else []
+        if last_row != manifest.get("last_row"):
+            # Baris di bulan yang sudah diarsip dihapus/disisipkan atau sheet menyusut
+            # (atau manifest lama tanpa sidik baris): offset tidak valid, arsip dibangun ulang
+            st.warning("⚠️ Baris lama di Google Sheet berubah; arsip bulanan dibangun ulang.")
+            manifest = _reset_rollups()
+            rows_archived = 0
+    
+    if rows_archived == 0:
+        values = ws.get_all_values()
+        header, rows = (values[0], values[1:]) if values else (TRANSACTION_COLUMNS, [])
+    manifest["header"] = header
+    
+    rows = [(list(row) + [""] * len(header))[:len(header)] for row in rows]
+    # Index = nomor baris di sheet, stabil meski offset arsip bergeser
+    df = pd.DataFrame(rows, columns=header, index=pd.RangeIndex(rows_archived + 2, rows_archived + 2 + len(rows)))
+    df['_row'] = np.arange(len(df))
+    df = parse_transactions(df)[LEDGER_COLUMNS + ['_row']]
+    df[AUTO_CATEGORY_COLUMN] = _uncategorized(df)
+    df = apply_category_rules(df)
+    
+    return compact_closed_months(df, rows, manifest)
+
+def load_full_ledger(df_live):
+    """Menggabungkan seluruh arsip bulan tertutup dengan data live (untuk export)."""
+    manifest = read_rollup_manifest()
+    archived = [load_archived_month(month, manifest) for month in manifest["months"]]
+    return pd.concat(archived + [df_live], ignore_index=True)
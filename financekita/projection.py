@@ -0,0 +1,96 @@
+"""Proyeksi arus kas 12 bulan dengan simulasi Monte Carlo (bootstrap bulanan).
+
+Riwayat diringkas menjadi matriks bulan × (Tipe, Kategori) bertanda
+(pemasukan positif, pengeluaran negatif). Setiap jalur simulasi mengambil
+bulan historis secara acak (dengan pengembalian) untuk tiap bulan ke depan;
+vektor kategori satu bulan diambil utuh supaya korelasi antar kategori
+(mis. bonus dan belanja besar di bulan yang sama) tetap terjaga. Semua jalur
+dihitung sekaligus sebagai array ``(n_paths, horizon)``.
+"""
+
+import numpy as np
+import pandas as pd
+
+N_PATHS = 10_000
+HORIZON_MONTHS = 12
+LOOKBACK_MONTHS = 36
+MIN_HISTORY_MONTHS = 3
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def current_balance(df_daily):
+    """Saldo akhir ledger: total pemasukan dikurangi total pengeluaran."""
+    income = df_daily["Tipe"] == "Pemasukan"
+    return float(df_daily.loc[income, "Jumlah"].sum() - df_daily.loc[~income, "Jumlah"].sum())
+
+
+def monthly_history(df_daily, as_of=None, lookback=LOOKBACK_MONTHS):
+    """Total bulanan bertanda per (Tipe, Kategori) untuk bulan yang sudah lengkap.
+
+    Bulan berjalan (berisi ``as_of``) tidak diikutkan karena belum lengkap,
+    begitu pula bulan pertama ledger bila pencatatan dimulai setelah tanggal 1.
+    """
+    as_of = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp.today()
+    current_month = as_of.to_period("M")
+    months = df_daily["Tanggal"].dt.to_period("M")
+    first_month = current_month - lookback
+    if len(df_daily):
+        first_day = df_daily["Tanggal"].min()
+        first_month = max(first_month, first_day.to_period("M") + (0 if first_day.day == 1 else 1))
+    complete = (months < current_month) & (months >= first_month)
+    df = df_daily[complete]
+    signed = df["Jumlah"].where(df["Tipe"] == "Pemasukan", -df["Jumlah"])
+    history = signed.groupby([months[complete], df["Tipe"], df["Kategori"]]).sum()
+    history = history.unstack(["Tipe", "Kategori"], fill_value=0.0)
+    # Bulan tanpa transaksi sama sekali tetap dihitung sebagai bulan nol
+    if len(history):
+        all_months = pd.period_range(history.index.min(), current_month - 1, freq="M")
+        history = history.reindex(all_months, fill_value=0.0)
+    return history
+
+
+def simulate(history, start_balance=0.0, n_paths=N_PATHS, horizon=HORIZON_MONTHS, seed=0):
+    """Saldo akhir tiap bulan untuk ``n_paths`` jalur: array ``(n_paths, horizon)``."""
+    monthly_net = history.to_numpy(float).sum(axis=1)
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(monthly_net), size=(n_paths, horizon))
+    return start_balance + np.cumsum(monthly_net[picks], axis=1)
+
+
+def summarize(paths, target, target_month, start_month, percentiles=PERCENTILES):
+    """Pita persentil saldo per bulan dan peluang mencapai target.
+
+    Mengembalikan ``(bands, probability)``: ``bands`` berkolom Bulan, P5..P95
+    dan Peluang Target (peluang saldo >= target di bulan tersebut);
+    ``probability`` untuk bulan ke-``target_month``.
+    """
+    horizon = paths.shape[1]
+    values = np.percentile(paths, percentiles, axis=0)
+    bands = pd.DataFrame({f"P{p}": row for p, row in zip(percentiles, values)})
+    bands.insert(0, "Bulan", pd.period_range(start_month, periods=horizon, freq="M").to_timestamp())
+    bands["Peluang Target"] = (paths >= target).mean(axis=0)
+    probability = float(bands["Peluang Target"].iloc[min(target_month, horizon) - 1])
+    return bands, probability
+
+
+def project(df_daily, target, target_month, start_balance=None, as_of=None, n_paths=N_PATHS,
+            horizon=HORIZON_MONTHS, seed=0):
+    """Riwayat -> simulasi -> ringkasan; ``None`` bila riwayat bulan lengkap terlalu pendek.
+
+    Tanpa ``start_balance`` simulasi dimulai dari saldo akhir ledger.
+    """
+    history = monthly_history(df_daily, as_of)
+    if len(history) < MIN_HISTORY_MONTHS:
+        return None
+    if start_balance is None:
+        start_balance = current_balance(df_daily)
+    paths = simulate(history, start_balance, n_paths, horizon, seed)
+    start_month = history.index.max() + 2  # bulan setelah bulan berjalan
+    bands, probability = summarize(paths, target, target_month, start_month)
+    return {
+        "bands": bands,
+        "start_balance": start_balance,
+        "probability": probability,
+        "history_months": len(history),
+        "monthly_mean": float(history.to_numpy(float).sum(axis=1).mean()),
+    }
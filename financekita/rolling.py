@@ -0,0 +1,117 @@
+"""Jumlah bergulir 7/30/90 hari (pengeluaran & net flow) dari total harian.
+
+State menyimpan prefix sum (kumulatif) total harian bertanda per
+(Tipe, Kategori): pemasukan positif, pengeluaran negatif. Jumlah jendela apa
+pun cukup dua lookup baris: ``cum[akhir] - cum[awal]``. Saat data baru datang,
+hanya baris mulai ``watermark`` (tanggal live paling awal) yang dihitung ulang;
+prefix sebelum watermark dipakai apa adanya.
+"""
+
+import numpy as np
+import pandas as pd
+
+ROLLING_WINDOWS = (7, 30, 90)
+
+
+def empty_state():
+    """State awal tanpa riwayat."""
+    return {
+        "dates": np.empty(0, dtype="datetime64[ns]"),
+        "keys": pd.MultiIndex.from_tuples([], names=["Tipe", "Kategori"]),
+        "cum": np.zeros((1, 0)),
+    }
+
+
+def _signed_matrix(df_daily, keys=None):
+    """Total harian bertanda sebagai matriks tanggal × (Tipe, Kategori)."""
+    signed = df_daily["Jumlah"].where(df_daily["Tipe"] == "Pemasukan", -df_daily["Jumlah"])
+    matrix = signed.groupby([df_daily["Tanggal"], df_daily["Tipe"], df_daily["Kategori"]]).sum()
+    matrix = matrix.unstack(["Tipe", "Kategori"], fill_value=0.0)
+    if keys is not None:
+        matrix = matrix.reindex(columns=keys, fill_value=0.0)
+    return matrix.index.to_numpy().astype("datetime64[ns]"), matrix.columns, matrix.to_numpy(float)
+
+
+def update_state(df_daily, state=None, watermark=None):
+    """Memperbarui prefix sum dengan baris ``Tanggal >= watermark``.
+
+    Tanpa ``state``/``watermark`` seluruh riwayat dihitung. Kategori baru
+    menambah kolom nol pada prefix lama.
+    """
+    if state is None or watermark is None:
+        state, watermark = empty_state(), None
+
+    cut = len(state["dates"])
+    if watermark is not None:
+        cut = int(np.searchsorted(state["dates"], np.datetime64(pd.Timestamp(watermark), "ns")))
+    tail = df_daily
+    if watermark is not None:
+        tail = df_daily[df_daily["Tanggal"] >= pd.Timestamp(watermark)]
+
+    keys = state["keys"]
+    new_keys = pd.MultiIndex.from_frame(tail[["Tipe", "Kategori"]].drop_duplicates())
+    keys = keys.append(new_keys.difference(keys)) if len(new_keys) else keys
+    prefix = state["cum"][:cut + 1]
+    if len(keys) > prefix.shape[1]:
+        prefix = np.hstack([prefix, np.zeros((len(prefix), len(keys) - prefix.shape[1]))])
+
+    if tail.empty:
+        dates, values = np.empty(0, dtype="datetime64[ns]"), np.zeros((0, len(keys)))
+    else:
+        dates, _, values = _signed_matrix(tail, keys)
+    return {
+        "dates": np.concatenate([state["dates"][:cut], dates]),
+        "keys": keys,
+        "cum": np.vstack([prefix, prefix[-1] + values.cumsum(axis=0)]),
+    }
+
+
+def _key_mask(state, kategori=None, tipe=None):
+    keys = state["keys"]
+    mask = np.ones(len(keys), dtype=bool)
+    if kategori is not None:
+        mask &= keys.get_level_values("Kategori").isin(kategori)
+    if tipe is not None:
+        mask &= keys.get_level_values("Tipe") == tipe
+    return mask
+
+
+def window_sums(state, end_dates, window, kategori=None, tipe=None):
+    """Jumlah bertanda ``window`` hari yang berakhir di tiap ``end_dates`` (inklusif).
+
+    Mengembalikan array (tanggal × kunci terpilih) dan index kunci terpilih.
+    """
+    mask = _key_mask(state, kategori, tipe)
+    end_dates = pd.DatetimeIndex(end_dates).to_numpy().astype("datetime64[ns]")
+    hi = np.searchsorted(state["dates"], end_dates + np.timedelta64(1, "D"))
+    lo = np.searchsorted(state["dates"], end_dates - np.timedelta64(window - 1, "D"))
+    cum = state["cum"][:, mask]
+    return cum[hi] - cum[lo], state["keys"][mask]
+
+
+def rolling_frame(state, start_date, end_date, kategori=None, windows=ROLLING_WINDOWS):
+    """Rata-rata harian bergulir untuk rentang tanggal, format panjang untuk chart.
+
+    Kolom: Tanggal, Jendela, Net (net flow/hari), Pengeluaran (belanja/hari).
+    """
+    days = pd.date_range(pd.Timestamp(start_date), pd.Timestamp(end_date), freq="D")
+    frames = []
+    for window in windows:
+        sums, keys = window_sums(state, days, window, kategori)
+        expense = (keys.get_level_values("Tipe") == "Pengeluaran")
+        frames.append(pd.DataFrame({
+            "Tanggal": days,
+            "Jendela": f"{window} hari",
+            "Net": sums.sum(axis=1) / window,
+            "Pengeluaran": -sums[:, expense].sum(axis=1) / window,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def category_spend(state, as_of, windows=ROLLING_WINDOWS):
+    """Pengeluaran per kategori untuk tiap jendela yang berakhir di ``as_of``."""
+    columns = {}
+    for window in windows:
+        sums, keys = window_sums(state, [as_of], window, tipe="Pengeluaran")
+        columns[f"{window} Hari"] = -sums[0]
+    return pd.DataFrame(columns, index=keys.get_level_values("Kategori"))
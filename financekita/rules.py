@@ -0,0 +1,149 @@
+"""Auto-kategori transaksi dari teks Catatan memakai aturan kata kunci.
+
+Semua kata kunci dikompilasi menjadi satu regex berbentuk trie (prefix yang
+sama digabung), sehingga setiap catatan cukup dipindai sekali dan tiap posisi
+hanya menelusuri satu jalur trie: kecocokan paling kiri menang, dan pada
+posisi yang sama kata kunci terpanjang menang ("grabfood" mengalahkan
+"grab"). Pencocokan tidak peka huruf besar.
+
+Hasil per baris (kata kunci, posisi, panjang) disimpan di state. Bila aturan
+hanya bertambah, baris lama cukup dipindai dengan regex kata kunci baru;
+kecocokan baru menggantikan yang lama bila lebih kiri, atau sama kiri tetapi
+lebih panjang. Menghapus aturan memicu pemindaian ulang penuh.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+RULE_COLUMNS = ["Kata Kunci", "Kategori"]
+
+
+def normalize_rules(rules):
+    """Frame aturan -> dict ``{kata kunci (huruf kecil): kategori}``; kata kunci ganda: yang pertama."""
+    mapping = {}
+    for keyword, category in zip(rules["Kata Kunci"], rules["Kategori"]):
+        if isinstance(keyword, str) and keyword.strip() and isinstance(category, str):
+            mapping.setdefault(keyword.strip().lower(), category.strip())
+    return mapping
+
+
+def _trie_pattern(keywords):
+    """Pola regex trie dari kata kunci, mis. ``g(?:ojek|rab(?:food)?)``."""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Lanjutan dibuat opsional (greedy) bila kata kunci lebih pendek juga berakhir
+        # di sini: kata kunci terpanjang dicoba lebih dulu
+        return "(?:" + body + ")?" if ends_here else body
+
+    return build(trie)
+
+
+def compile_keywords(keywords):
+    """Satu regex untuk semua kata kunci; ``None`` bila kosong."""
+    if not keywords:
+        return None
+    return re.compile(_trie_pattern(keywords))
+
+
+def match_notes(notes, keywords):
+    """Kecocokan terbaik per catatan: array (kata kunci, posisi, panjang).
+
+    Catatan tanpa kecocokan mendapat kata kunci ``None`` dan posisi ``inf``.
+    ``notes`` harus sudah huruf kecil.
+    """
+    n = len(notes)
+    matched = np.full(n, None, dtype=object)
+    start = np.full(n, np.inf)
+    length = np.zeros(n)
+    pattern = compile_keywords(keywords)
+    if pattern is None:
+        return matched, start, length
+
+    search = pattern.search
+    for i, note in enumerate(notes):
+        found = search(note)
+        if found is not None:
+            matched[i] = found.group()
+            start[i] = found.start()
+            length[i] = found.end() - found.start()
+    return matched, start, length
+
+
+def empty_state():
+    """State awal tanpa baris maupun aturan."""
+    return {
+        "keywords": frozenset(),
+        "notes": pd.Series(dtype=object),
+        "matched": np.empty(0, dtype=object),
+        "start": np.empty(0),
+        "length": np.empty(0),
+    }
+
+
+def categorize(notes, rules, state=None):
+    """Kategori per catatan menurut ``rules`` (dict dari ``normalize_rules``).
+
+    Mengembalikan ``(categories, new_state)``; ``categories`` ber-index sama
+    dengan ``notes`` dan bernilai NaN bila tidak ada aturan yang cocok. Baris
+    yang sudah ada di ``state`` dengan catatan yang sama hanya dipindai ulang
+    untuk kata kunci yang baru ditambahkan.
+    """
+    state = state or empty_state()
+    keywords = frozenset(rules)
+    lowered = notes.fillna("").astype(str).str.lower()
+
+    incremental = state["keywords"] <= keywords
+    known = pd.Series(np.arange(len(state["notes"])), index=state["notes"].index)
+    positions = known.reindex(lowered.index).to_numpy()
+    reuse = ~np.isnan(positions)
+    if reuse.any():
+        # Baris yang catatannya diubah di sheet dipindai ulang penuh
+        previous_notes = state["notes"].to_numpy()[positions[reuse].astype(int)]
+        reuse[reuse] = previous_notes == lowered.to_numpy()[reuse]
+    if not incremental:
+        reuse[:] = False
+
+    matched = np.full(len(lowered), None, dtype=object)
+    start = np.full(len(lowered), np.inf)
+    length = np.zeros(len(lowered))
+
+    fresh = ~reuse
+    if fresh.any():
+        matched[fresh], start[fresh], length[fresh] = match_notes(lowered.to_numpy()[fresh], keywords)
+
+    if reuse.any():
+        old = positions[reuse].astype(int)
+        matched[reuse] = state["matched"][old]
+        start[reuse] = state["start"][old]
+        length[reuse] = state["length"][old]
+        new_keywords = keywords - state["keywords"]
+        if new_keywords:
+            new_matched, new_start, new_length = match_notes(lowered.to_numpy()[reuse], new_keywords)
+            better = (new_start < start[reuse]) | ((new_start == start[reuse]) & (new_length > length[reuse]))
+            targets = np.flatnonzero(reuse)[better]
+            matched[targets] = new_matched[better]
+            start[targets] = new_start[better]
+            length[targets] = new_length[better]
+
+    new_state = {
+        "keywords": keywords,
+        "notes": lowered,
+        "matched": matched,
+        "start": start,
+        "length": length,
+    }
+    categories = pd.Series(matched, index=notes.index, dtype=object).map(rules)
+    return categories, new_state
@@ -0,0 +1,119 @@
+"""Cache snapshot ledger lintas proses berbasis file Arrow IPC di disk lokal.
+
+Beberapa proses server Streamlit (replika di belakang load balancer) berbagi
+satu direktori:
+
+- ``manifest.json`` mencatat ``revision`` terbaru beserta nama file tiap frame
+  dan metadata (kunci data, versi aturan kategori, ...).
+- Tiap frame ditulis sebagai ``rev-<revision>.<nama>.arrow`` (format file IPC,
+  tanpa kompresi) lalu manifest diganti secara atomik, sehingga pembaca selalu
+  melihat snapshot utuh.
+- Pembaca memetakan file dengan ``pyarrow.memory_map``: buffer kolom dibaca
+  langsung dari page cache OS yang sama untuk semua replika, tanpa parsing.
+- ``refresh_lock`` adalah file lock lintas proses; hanya replika yang
+  memegangnya yang mengambil ulang data dari Sheets, replika lain menunggu
+  lalu memetakan revisi baru.
+"""
+
+import contextlib
+import json
+import os
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.ipc
+
+try:
+    import fcntl
+except ImportError:  # Windows: tanpa lock lintas proses
+    fcntl = None
+
+MANIFEST_NAME = "manifest.json"
+KEEP_REVISIONS = 2  # revisi sebelumnya tetap ada untuk pembaca yang sedang memetakan
+
+
+def read_manifest(cache_dir):
+    """Manifest snapshot terbaru, atau ``None`` bila belum pernah ditulis."""
+    try:
+        with open(Path(cache_dir) / MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_manifest(cache_dir, manifest):
+    tmp_path = Path(cache_dir) / f"{MANIFEST_NAME}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, Path(cache_dir) / MANIFEST_NAME)
+
+
+def write_snapshot(cache_dir, revision, frames, **meta):
+    """Menulis frame sebagai file Arrow IPC untuk ``revision`` lalu menerbitkan manifest."""
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for name, df in frames.items():
+        file_name = f"rev-{revision:08d}.{name}.arrow"
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        tmp_path = cache_dir / f"{file_name}.{os.getpid()}.tmp"
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, cache_dir / file_name)
+        files[name] = file_name
+
+    manifest = dict(meta, revision=revision, files=files)
+    _write_manifest(cache_dir, manifest)
+    _remove_old_revisions(cache_dir, revision)
+    return manifest
+
+
+def invalidate(cache_dir):
+    """Menandai snapshot di disk kedaluwarsa tanpa menghapus file-nya."""
+    manifest = read_manifest(cache_dir)
+    if manifest is not None and manifest.get("valid", True):
+        _write_manifest(cache_dir, dict(manifest, valid=False))
+
+
+def _remove_old_revisions(cache_dir, revision):
+    for path in Path(cache_dir).glob("rev-*.arrow"):
+        file_revision = int(path.name.split(".")[0][len("rev-"):])
+        if file_revision <= revision - KEEP_REVISIONS:
+            # Di POSIX, proses yang masih memetakan file tetap aman setelah unlink
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def map_snapshot(cache_dir, manifest):
+    """Frame snapshot dari file Arrow yang dipetakan ke memori.
+
+    Buffer Arrow dibaca zero-copy dari mmap; konversi ke pandas memakai
+    ``split_blocks`` supaya kolom numerik tidak digabung ulang ke satu blok.
+    """
+    frames = {}
+    for name, file_name in manifest["files"].items():
+        source = pa.memory_map(str(Path(cache_dir) / file_name), "r")
+        table = pa.ipc.open_file(source).read_all()
+        frames[name] = table.to_pandas(split_blocks=True)
+    return frames
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Lock eksklusif lintas proses pada file ``path`` (dibuat bila belum ada)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def refresh_lock(cache_dir):
+    """Lock eksklusif lintas proses selama satu replika mengambil ulang data."""
+    return file_lock(Path(cache_dir) / "refresh.lock")
@@ -0,0 +1,971 @@
+"""Halaman Streamlit FinanceKita: sidebar input, filter, metrik dan tab dashboard."""
+
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from financekita import anomaly, charts, projection, rolling, rules
+from financekita.analytics import (
+    PERIOD_WINDOWS,
+    SORT_OPTIONS,
+    build_expense_calendar,
+    build_period_totals,
+    build_sort_orders,
+    calculate_budget_vs_actual,
+    calculate_burn_rate,
+    compare_periods,
+    detect_anomalies_with_cache,
+    forecast_next_month,
+    percent_change,
+    rolling_with_cache,
+)
+from financekita.api import API_HOST, API_PORT, start_summary_api
+from financekita.data import (
+    DEFAULT_BUDGET_SETTINGS,
+    REPORTING_CURRENCY,
+    SESSION_MEMORY_BUDGET_MB,
+    TRANSACTION_COLUMNS,
+    UNCATEGORIZED,
+    cached_per_revision,
+    connect_worksheet,
+    enforce_session_memory_budget,
+    invalidate_shared_ledger,
+    load_archived_month,
+    load_category_rules,
+    load_data_with_cache,
+    load_full_ledger,
+    load_fx_rates,
+    read_rollup_manifest,
+    session_memory_bytes,
+    shared_ledger,
+    shared_memory_bytes,
+)
+
+# Opsi form: kategori ditebak dari Catatan memakai aturan kata kunci
+AUTO_CATEGORY = "🤖 Otomatis (dari Catatan)"
+
+# --- Custom CSS untuk UI yang lebih baik ---
+PAGE_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem !important;
+        font-weight: 800 !important;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        padding-bottom: 10px;
+    }
+    .metric-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 15px;
+        padding: 20px;
+        color: white;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+    .stProgress > div > div > div > div {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    }
+    .sidebar-header {
+        font-size: 1.5rem !important;
+        font-weight: 700 !important;
+        color: #764ba2 !important;
+        margin-top: 10px;
+        margin-bottom: 10px;
+    }
+    .quick-action-btn {
+        width: 100%;
+        margin: 5px 0;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white !important;
+        border: none;
+    }
+    .quick-action-btn:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+    }
+    .dataframe tbody tr:hover {
+        background-color: rgba(102, 126, 234, 0.1) !important;
+    }
+</style>
+"""
+
+def render_header():
+    """CSS halaman dan judul utama."""
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+    # --- Judul Utama ---
+    st.markdown('<h1 class="main-header">💸 Dashboard FinanceKita PRO</h1>', unsafe_allow_html=True)
+    st.caption(f"🚀 Versi 5.0 | Tersambung ke Google Sheets | Data per: {datetime.now().strftime('%d %B %Y %H:%M')}")
+
+def connect():
+    """Worksheet dari secrets (koneksi di-cache per proses); ``None`` bila gagal."""
+    try:
+        return connect_worksheet(
+            dict(st.secrets["gsheets_credentials"]),
+            st.secrets["GSHEET_URL"],
+            st.secrets["WORKSHEET_NAME"],
+        )
+    except Exception as e:
+        st.error(f"❌ Gagal terhubung ke Google Sheets: {e}")
+        return None
+
+# --- ====================================================== ---
+# ---                     SIDEBAR                          ---
+# --- ====================================================== ---
+
+def render_sidebar(worksheet):
+    """Form input, quick actions, budget, refresh & export; mengembalikan isian form."""
+    with st.sidebar:
+        st.markdown('<h3 class="sidebar-header">📝 Input Transaksi</h3>', unsafe_allow_html=True)
+        
+        tipe = st.radio("**Tipe Transaksi**", ["Pemasukan", "Pengeluaran"], 
+                        horizontal=True, index=1, label_visibility="collapsed")
+        
+        if tipe == "Pengeluaran":
+            kategori_options = ["🏠 Rumah Tangga", "🍔 Makanan", "🚗 Transportasi", 
+                               "🧾 Tagihan", "👨‍⚕️ Kesehatan", "🎉 Hiburan", 
+                               "📚 Pendidikan", "🛒 Belanja", "🎁 Hadiah/Amal", "Lainnya"]
+        else:
+            kategori_options = ["💼 Gaji", "💰 Bonus", "📈 Investasi", 
+                               "💻 Freelance", "🎁 Hadiah", "Lainnya"]
+        
+        # Kategori bisa ditebak dari Catatan bila ada aturan kata kunci
+        if load_category_rules():
+            kategori_options = kategori_options + [AUTO_CATEGORY]
+        
+        with st.form("transaction_form", clear_on_submit=True):
+            tanggal = st.date_input("📅 Tanggal", datetime.now())
+            kategori = st.selectbox("🏷️ Kategori", kategori_options)
+            # Mata uang lain hanya ditawarkan bila ada di tabel kurs lokal
+            currency_options = [REPORTING_CURRENCY] + sorted(
+                set(load_fx_rates()['Mata Uang'].unique()) - {REPORTING_CURRENCY}
+            )
+            if len(currency_options) > 1:
+                mata_uang = st.selectbox("💱 Mata Uang", currency_options)
+            else:
+                mata_uang = REPORTING_CURRENCY
+            jumlah = st.number_input("💰 Jumlah", min_value=1.0, step=1000.0, 
+                                    format="%.0f", help="Masukkan jumlah tanpa titik")
+            catatan = st.text_area("📝 Catatan (Opsional)", height=80,
+                                  placeholder="Deskripsi transaksi...")
+            
+            submitted = st.form_submit_button("✅ **Tambah Transaksi**", use_container_width=True)
+        
+        # --- QUICK ACTIONS ---
+        st.markdown('<h3 class="sidebar-header">⚡ Quick Actions</h3>', unsafe_allow_html=True)
+        
+        quick_actions = {
+            "🍔 Makan Siang": 50000,
+            "☕ Kopi": 25000,
+            "⛽ Bensin": 150000,
+            "📦 GrabFood": 75000,
+            "🛒 Minimarket": 100000,
+        }
+        
+        cols = st.columns(2)
+        for idx, (name, amount) in enumerate(quick_actions.items()):
+            with cols[idx % 2]:
+                if st.button(f"{name}\nRp{amount:,}", 
+                             use_container_width=True,
+                             key=f"quick_{idx}"):
+                    # Auto-fill form dengan session state
+                    st.session_state.quick_amount = amount
+                    st.session_state.quick_category = name.split(" ")[1] if " " in name else name
+                    st.rerun()
+        
+        # --- BUDGET SETTINGS ---
+        st.markdown('<h3 class="sidebar-header">🎯 Budget Bulanan</h3>', unsafe_allow_html=True)
+        
+        # Initialize budget settings in session state
+        if 'budget_settings' not in st.session_state:
+            st.session_state.budget_settings = dict(DEFAULT_BUDGET_SETTINGS)
+        
+        budget_categories = ["Makanan", "Transportasi", "Hiburan", "Belanja"]
+        for cat in budget_categories:
+            st.session_state.budget_settings[cat] = st.number_input(
+                f"Budget {cat}", 
+                min_value=0, 
+                value=st.session_state.budget_settings[cat],
+                step=100000,
+                key=f"budget_{cat}"
+            )
+        shared_ledger()["budget_settings"] = dict(st.session_state.budget_settings)
+        
+        # --- REFRESH DATA ---
+        st.markdown('<h3 class="sidebar-header">🔄 Refresh Data</h3>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔄 Refresh", use_container_width=True):
+                # Clear cache bersama agar semua sesi memakai data terbaru
+                invalidate_shared_ledger()
+                st.rerun()
+        
+        with col2:
+            if st.button("📊 Stats", use_container_width=True):
+                st.session_state.show_stats = True
+        
+        # --- EXPORT DATA ---
+        st.markdown('<h3 class="sidebar-header">💾 Export Data</h3>', unsafe_allow_html=True)
+        
+        if st.button("📥 Export CSV", use_container_width=True):
+            if worksheet is not None:
+                df = load_full_ledger(load_data_with_cache(worksheet).live)
+                csv = df.to_csv(index=False)
+                st.download_button(
+                    label="Download CSV",
+                    data=csv,
+                    file_name=f"finance_backup_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
+    
+    return {
+        "submitted": submitted,
+        "tipe": tipe,
+        "tanggal": tanggal,
+        "kategori": kategori,
+        "mata_uang": mata_uang,
+        "jumlah": jumlah,
+        "catatan": catatan,
+    }
+
+def save_transaction(worksheet, form):
+    """Menambah transaksi dari form sidebar ke Google Sheet."""
+    if worksheet is None:
+        st.sidebar.error("❌ Koneksi GSheet gagal, tidak bisa menambah transaksi.")
+        return
+    
+    try:
+        if form["jumlah"] <= 0:
+            st.sidebar.warning("❌ Jumlah harus lebih besar dari 0.")
+            return
+        
+        with st.sidebar:
+            with st.spinner("Menyimpan transaksi..."):
+                mata_uang = form["mata_uang"]
+                kategori = form["kategori"]
+                if kategori == AUTO_CATEGORY:
+                    categories, _ = rules.categorize(pd.Series([form["catatan"]]), load_category_rules())
+                    kategori = categories.fillna(UNCATEGORIZED).iloc[0]
+                values_by_column = {
+                    "Tanggal": form["tanggal"].strftime("%Y-%m-%d"),
+                    "Tipe": form["tipe"],
+                    "Kategori": kategori,
+                    "Jumlah": form["jumlah"],
+                    "Catatan": form["catatan"] or "",
+                    "Mata Uang": mata_uang,
+                }
+                header = worksheet.row_values(1)
+                if not header:
+                    header = TRANSACTION_COLUMNS + ["Mata Uang"]
+                    worksheet.append_row(header)
+                elif mata_uang != REPORTING_CURRENCY and "Mata Uang" not in header:
+                    # Kolom mata uang opsional, ditambahkan saat pertama dibutuhkan
+                    header = header + ["Mata Uang"]
+                    worksheet.update_cell(1, len(header), "Mata Uang")
+                new_row = [values_by_column.get(col, "") for col in header]
+                worksheet.append_row(new_row)
+                
+                # Clear cache agar data terbaru di-load
+                invalidate_shared_ledger()
+                
+                time.sleep(1)
+                st.success("✅ Transaksi berhasil ditambahkan!")
+                time.sleep(1.5)
+                st.rerun()
+    except Exception as e:
+        st.sidebar.error(f"❌ Gagal menyimpan: {e}")
+
+# --- ====================================================== ---
+# ---               MAIN DASHBOARD                          ---
+# --- ====================================================== ---
+
+def render_filters(df):
+    """Filter tanggal & kategori; mengembalikan (start_date, end_date, selected_kategori, all_kategori)."""
+    st.header("🔍 Filter Dashboard")
+    
+    min_date = df['Tanggal'].min().date()
+    max_date = df['Tanggal'].max().date()
+    
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        start_date = st.date_input("Dari", min_date, min_value=min_date, max_value=max_date)
+    with col2:
+        end_date = st.date_input("Sampai", max_date, min_value=min_date, max_value=max_date)
+    with col3:
+        all_kategori = cached_per_revision('all_kategori', lambda: df['Kategori'].unique().tolist())
+        selected_kategori = st.multiselect(
+            "Kategori", 
+            all_kategori, 
+            default=all_kategori,
+            placeholder="Pilih kategori..."
+        )
+    
+    # --- Quick Date Range Buttons ---
+    col_quick = st.columns(5)
+    with col_quick[0]:
+        if st.button("Hari Ini", use_container_width=True, key="btn_today"):
+            start_date = datetime.now().date()
+            end_date = start_date
+    with col_quick[1]:
+        if st.button("7 Hari", use_container_width=True, key="btn_7days"):
+            end_date = datetime.now().date()
+            start_date = end_date - timedelta(days=6)
+    with col_quick[2]:
+        if st.button("Bulan Ini", use_container_width=True, key="btn_month"):
+            start_date = datetime.now().replace(day=1).date()
+            end_date = datetime.now().date()
+    with col_quick[3]:
+        if st.button("3 Bulan", use_container_width=True, key="btn_3months"):
+            end_date = datetime.now().date()
+            start_date = (pd.Timestamp(end_date) - pd.DateOffset(months=3)).date()
+    with col_quick[4]:
+        if st.button("Semua", use_container_width=True, key="btn_all"):
+            start_date = min_date
+            end_date = max_date
+    
+    st.divider()
+    
+    return start_date, end_date, selected_kategori, all_kategori
+
+def filter_daily(df, start_date, end_date, selected_kategori, all_kategori):
+    """Rentang tanggal & kategori di atas frame total harian."""
+    range_start, range_end = df['Tanggal'].searchsorted(
+        [pd.Timestamp(start_date), pd.Timestamp(end_date) + timedelta(days=1)]
+    )
+    df_filtered = df.iloc[range_start:range_end]
+    if len(selected_kategori) < len(all_kategori):
+        df_filtered = df_filtered[df_filtered['Kategori'].isin(selected_kategori)]
+    return df_filtered
+
+def format_deltas(values):
+    """Teks delta kartu metrik dari ``[berjalan, sebelumnya, tahun lalu]``."""
+    changes = percent_change(values[0], values[1:])
+    parts = []
+    for label, change in zip(["periode lalu", "tahun lalu"], changes):
+        if np.isfinite(change):
+            parts.append(f"{'▲' if change >= 0 else '▼'} {abs(change):.1f}% vs {label}")
+        else:
+            parts.append(f"– vs {label}")
+    return " · ".join(parts)
+
+def render_metrics(df, comparison, start_date, end_date):
+    """Kartu metrik utama beserta delta terhadap periode sebelumnya & tahun lalu."""
+    # Satu agregasi per tipe untuk ketiga jendela perbandingan
+    by_tipe = comparison.groupby(level='Tipe').sum().reindex(['Pemasukan', 'Pengeluaran'], fill_value=0)
+    jumlah_columns = [f'Jumlah{suffix}' for suffix in PERIOD_WINDOWS]
+    transaksi_columns = [f'Transaksi{suffix}' for suffix in PERIOD_WINDOWS]
+    pemasukan = by_tipe.loc['Pemasukan', jumlah_columns].to_numpy()
+    pengeluaran = by_tipe.loc['Pengeluaran', jumlah_columns].to_numpy()
+    saldo_periode = pemasukan - pengeluaran
+    transaksi = by_tipe[transaksi_columns].sum().to_numpy()
+    
+    total_pemasukan, total_pengeluaran, saldo = pemasukan[0], pengeluaran[0], saldo_periode[0]
+    jumlah_transaksi = int(transaksi[0])
+    jumlah_pemasukan = int(by_tipe.loc['Pemasukan', 'Transaksi'])
+    jumlah_pengeluaran = jumlah_transaksi - jumlah_pemasukan
+    
+    total_hari = (end_date - start_date).days + 1
+    avg_pengeluaran_harian = total_pengeluaran / total_hari if total_hari > 0 else 0
+    
+    # Forecast untuk bulan depan
+    forecast = forecast_next_month(df)
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div style="font-size: 0.9rem; opacity: 0.9;">Total Pemasukan</div>
+            <div style="font-size: 1.8rem; font-weight: bold;">Rp {total_pemasukan:,.0f}</div>
+            <div style="font-size: 0.8rem;">↑ {total_pemasukan/jumlah_pemasukan:,.0f}/transaksi</div>
+            <div style="font-size: 0.75rem; opacity: 0.85;">{format_deltas(pemasukan)}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div style="font-size: 0.9rem; opacity: 0.9;">Total Pengeluaran</div>
+            <div style="font-size: 1.8rem; font-weight: bold;">Rp {total_pengeluaran:,.0f}</div>
+            <div style="font-size: 0.8rem;">↓ {avg_pengeluaran_harian:,.0f}/hari</div>
+            <div style="font-size: 0.75rem; opacity: 0.85;">{format_deltas(pengeluaran)}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        saldo_color = "#4CAF50" if saldo >= 0 else "#F44336"
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {"#4CAF50" if saldo >= 0 else "#F44336"} 0%, {"#388E3C" if saldo >= 0 else "#D32F2F"} 100%); 
+                    border-radius: 15px; padding: 20px; color: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; opacity: 0.9;">Saldo Akhir</div>
+            <div style="font-size: 1.8rem; font-weight: bold;">Rp {saldo:,.0f}</div>
+            <div style="font-size: 0.8rem;">{"🟢 Surplus" if saldo >= 0 else "🔴 Defisit"}</div>
+            <div style="font-size: 0.75rem; opacity: 0.85;">{format_deltas(saldo_periode)}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div style="font-size: 0.9rem; opacity: 0.9;">Jumlah Transaksi</div>
+            <div style="font-size: 1.8rem; font-weight: bold;">{jumlah_transaksi:,}</div>
+            <div style="font-size: 0.8rem;">{jumlah_pemasukan:,} pemasukan, {jumlah_pengeluaran:,} pengeluaran</div>
+            <div style="font-size: 0.75rem; opacity: 0.85;">{format_deltas(transaksi)}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col5:
+        forecast_text = f"Rp {forecast:,.0f}" if forecast else "Tidak cukup data"
+        st.markdown(f"""
+        <div class="metric-card">
+            <div style="font-size: 0.9rem; opacity: 0.9;">Prediksi Bulan Depan</div>
+            <div style="font-size: 1.5rem; font-weight: bold;">{forecast_text}</div>
+            <div style="font-size: 0.8rem;">Berdasarkan 3 bulan terakhir</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_ringkasan(df, df_filtered, start_date, end_date, selected_kategori, flagged_days, flagged_transactions,
+                     rolling_state):
+    """Tab Ringkasan: cash flow, saldo kumulatif, trend bulanan & anomali."""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Cash Flow Harian")
+        net_flow = df_filtered['Jumlah'].where(df_filtered['Tipe'] == 'Pemasukan', -df_filtered['Jumlah'])
+        daily_net = net_flow.groupby(df_filtered['Tanggal']).sum().rename('Net').reset_index()
+        
+        if not daily_net.empty:
+            # Garis rata-rata 7/30/90 hari per hari, dari prefix sum bersama
+            df_rolling = rolling.rolling_frame(rolling_state, start_date, end_date, kategori=selected_kategori)
+            st.altair_chart(charts.create_daily_net_chart(daily_net, df_rolling), use_container_width=True)
+    
+    with col2:
+        st.subheader("Saldo Kumulatif")
+        # Saldo akhir hari = kumulatif net harian (daily_net sudah urut tanggal)
+        df_cumulative = daily_net.assign(**{'Saldo Kumulatif': daily_net['Net'].cumsum()})
+        
+        if not df_cumulative.empty:
+            st.altair_chart(charts.create_cumulative_chart(df_cumulative), use_container_width=True)
+    
+    # Trend Bulanan
+    st.subheader("Trend Bulanan")
+    trend_chart = charts.create_monthly_trend_chart(df)
+    if trend_chart:
+        st.altair_chart(trend_chart, use_container_width=True)
+    
+    # Anomali pengeluaran pada rentang filter
+    st.subheader("🚨 Anomali Pengeluaran")
+    in_range_days = flagged_days[
+        (flagged_days['Tanggal'].dt.date >= start_date) &
+        (flagged_days['Tanggal'].dt.date <= end_date) &
+        (flagged_days['Kategori'].isin(selected_kategori + [anomaly.TOTAL_HARIAN]))
+    ]
+    in_range_transactions = flagged_transactions[
+        (flagged_transactions['Tanggal'].dt.date >= start_date) &
+        (flagged_transactions['Tanggal'].dt.date <= end_date) &
+        (flagged_transactions['Kategori'].isin(selected_kategori))
+    ]
+    
+    if in_range_days.empty and in_range_transactions.empty:
+        st.success("Tidak ada pengeluaran yang tidak biasa pada periode ini.")
+    else:
+        anomaly_columns = {
+            "Tanggal": st.column_config.DateColumn("Tanggal", format="DD/MM/YYYY"),
+            "Jumlah": st.column_config.NumberColumn("Jumlah (Rp)", format="Rp %'.0f"),
+            "Rata-rata": st.column_config.NumberColumn("Normalnya (Rp)", format="Rp %'.0f"),
+            "Skor-Z": st.column_config.NumberColumn("Skor-Z", format="%.1f σ"),
+        }
+        col_anom1, col_anom2 = st.columns(2)
+        with col_anom1:
+            st.caption(f"Hari tidak biasa: {len(in_range_days)}")
+            st.dataframe(
+                in_range_days.sort_values('Tanggal', ascending=False)[['Tanggal', 'Kategori', 'Jumlah', 'Rata-rata', 'Skor-Z']],
+                column_config=anomaly_columns,
+                use_container_width=True,
+                hide_index=True
+            )
+        with col_anom2:
+            st.caption(f"Transaksi tidak biasa (bulan berjalan): {len(in_range_transactions)}")
+            st.dataframe(
+                in_range_transactions.sort_values('Tanggal', ascending=False)[['Tanggal', 'Kategori', 'Jumlah', 'Rata-rata', 'Skor-Z', 'Catatan']],
+                column_config=anomaly_columns,
+                use_container_width=True,
+                hide_index=True
+            )
+
+def render_analisis(df_filtered):
+    """Tab Analisis: proporsi, top 5 dan diagram alir dana."""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Proporsi Pengeluaran")
+        df_pengeluaran = df_filtered[df_filtered["Tipe"] == "Pengeluaran"]
+        if not df_pengeluaran.empty:
+            df_chart_pengeluaran = df_pengeluaran.groupby("Kategori")["Jumlah"].sum().reset_index()
+            donut_pengeluaran = charts.create_donut_chart(df_chart_pengeluaran, "Pengeluaran", "reds")
+            if donut_pengeluaran:
+                st.altair_chart(donut_pengeluaran, use_container_width=True)
+        
+        # Top 5 Pengeluaran
+        st.subheader("🔥 Top 5 Pengeluaran")
+        if not df_pengeluaran.empty:
+            df_top5 = df_pengeluaran.groupby('Kategori')['Jumlah'].sum().nlargest(5).reset_index()
+            df_top5.index = range(1, len(df_top5) + 1)
+            
+            for idx, row in df_top5.iterrows():
+                percent = (row['Jumlah'] / df_pengeluaran['Jumlah'].sum()) * 100
+                st.progress(min(percent/100, 1.0), 
+                           text=f"{row['Kategori']}: Rp{row['Jumlah']:,.0f} ({percent:.1f}%)")
+    
+    with col2:
+        st.subheader("Proporsi Pemasukan")
+        df_pemasukan = df_filtered[df_filtered["Tipe"] == "Pemasukan"]
+        if not df_pemasukan.empty:
+            df_chart_pemasukan = df_pemasukan.groupby("Kategori")["Jumlah"].sum().reset_index()
+            donut_pemasukan = charts.create_donut_chart(df_chart_pemasukan, "Pemasukan", "greens")
+            if donut_pemasukan:
+                st.altair_chart(donut_pemasukan, use_container_width=True)
+        
+        # Sankey Diagram
+        st.subheader("Diagram Alir Dana")
+        # Plotly baru di-import saat diagram ini pertama kali dibuka
+        if st.toggle("Tampilkan diagram alir", key="show_sankey"):
+            sankey = charts.create_sankey_chart(df_filtered, "Aliran Dana")
+            if sankey:
+                st.plotly_chart(sankey, use_container_width=True)
+
+def render_kalender(df):
+    """Tab Kalender: heatmap bulanan, 12 bulan terakhir atau multi-tahun."""
+    st.subheader("Kalender Pengeluaran")
+    
+    # Seri harian semua bulan dihitung sekali per revisi data
+    df_calendar, calendar_months, month_stats = cached_per_revision(
+        'expense_calendar', build_expense_calendar, df
+    )
+    available_months = sorted(month_stats.index[month_stats['Hari Transaksi'] > 0], reverse=True)
+    
+    calendar_view = st.radio(
+        "Tampilan",
+        ["Bulanan", "12 Bulan Terakhir", "Multi-Tahun"],
+        horizontal=True,
+        key="calendar_view"
+    )
+    
+    if calendar_view == "12 Bulan Terakhir":
+        window_start = df_calendar['Tanggal'].max() - pd.DateOffset(months=12) + timedelta(days=1)
+        heatmap = charts.create_year_heatmap(
+            df_calendar[df_calendar['Tanggal'] >= window_start],
+            "Peta Panas Pengeluaran 12 Bulan Terakhir"
+        )
+        if heatmap:
+            st.altair_chart(heatmap, use_container_width=True)
+    
+    elif calendar_view == "Multi-Tahun":
+        heatmap = charts.create_year_heatmap(df_calendar, "Peta Panas Pengeluaran per Tahun", by_year=True)
+        if heatmap:
+            st.altair_chart(heatmap, use_container_width=True)
+    
+    elif available_months:
+        selected_month = st.selectbox("Pilih Bulan", available_months, key="select_month")
+        
+        # Heatmap
+        heatmap = charts.create_calendar_heatmap(calendar_months.get(selected_month), selected_month)
+        if heatmap:
+            st.altair_chart(heatmap, use_container_width=True)
+        
+        # Statistik bulan tersebut
+        stats = month_stats.loc[selected_month]
+        if stats['Hari Transaksi'] > 0:
+            col_stat1, col_stat2, col_stat3 = st.columns(3)
+            with col_stat1:
+                total_month = stats['Total']
+                st.metric(f"Total Pengeluaran {selected_month}", f"Rp {total_month:,.0f}")
+            with col_stat2:
+                avg_daily = total_month / stats['Hari Transaksi']
+                st.metric("Rata-rata Harian", f"Rp {avg_daily:,.0f}")
+            with col_stat3:
+                st.metric("Hari dengan Pengeluaran", f"{int(stats['Hari Pengeluaran'])}/{int(stats['Hari Transaksi'])}")
+
+def render_budgeting(df, df_filtered, rolling_state, end_date):
+    """Tab Budgeting: budget vs actual, rekomendasi, laju pengeluaran dan proyeksi tabungan."""
+    st.subheader("Budget vs Actual Spending")
+    
+    # Hitung perbandingan budget vs actual
+    budget_vs_actual = calculate_budget_vs_actual(df_filtered, st.session_state.budget_settings)
+    
+    if not budget_vs_actual.empty:
+        # Tampilkan sebagai tabel
+        st.dataframe(
+            budget_vs_actual,
+            column_config={
+                "Kategori": "Kategori",
+                "Budget": st.column_config.NumberColumn("Budget (Rp)", format="Rp %'.0f"),
+                "Actual": st.column_config.NumberColumn("Actual (Rp)", format="Rp %'.0f"),
+                "Percentage": st.column_config.ProgressColumn(
+                    "Persentase",
+                    format="%.1f%%",
+                    min_value=0,
+                    max_value=150,
+                ),
+                "Status": "Status"
+            },
+            use_container_width=True
+        )
+        
+        # Visualisasi perbandingan
+        st.subheader("Visualisasi Budget vs Actual")
+        
+        st.altair_chart(charts.create_budget_chart(budget_vs_actual), use_container_width=True)
+        
+        # Rekomendasi berdasarkan budget
+        st.subheader("💡 Rekomendasi")
+        for _, row in budget_vs_actual.iterrows():
+            if row['Percentage'] > 100:
+                st.warning(f"**{row['Kategori']}**: Melebihi budget sebesar {row['Percentage']-100:.1f}%. Perlu dikurangi pengeluarannya.")
+            elif row['Percentage'] > 80:
+                st.info(f"**{row['Kategori']}**: Mendekati limit budget ({row['Percentage']:.1f}%). Hati-hati dalam pengeluaran.")
+            else:
+                st.success(f"**{row['Kategori']}**: Masih dalam budget ({row['Percentage']:.1f}%). Bagus!")
+        
+        # Laju pengeluaran bergulir sampai akhir rentang filter
+        st.subheader("🔥 Burn Rate")
+        burn_rate = calculate_burn_rate(rolling_state, st.session_state.budget_settings, end_date)
+        st.dataframe(
+            burn_rate,
+            column_config={
+                "Budget": st.column_config.NumberColumn("Budget (Rp)", format="Rp %'.0f"),
+                "7 Hari": st.column_config.NumberColumn("7 Hari Terakhir (Rp)", format="Rp %'.0f"),
+                "30 Hari": st.column_config.NumberColumn("30 Hari Terakhir (Rp)", format="Rp %'.0f"),
+                "Proyeksi 30 Hari": st.column_config.NumberColumn("Proyeksi 30 Hari (Rp)", format="Rp %'.0f"),
+                "Laju": st.column_config.ProgressColumn(
+                    "Laju vs Budget",
+                    format="%.1f%%",
+                    min_value=0,
+                    max_value=150,
+                ),
+            },
+            use_container_width=True,
+            hide_index=True
+        )
+        for _, row in burn_rate[burn_rate['Laju'] > 100].iterrows():
+            st.warning(f"**{row['Kategori']}**: Dengan laju 7 hari terakhir, pengeluaran diproyeksikan "
+                       f"Rp {row['Proyeksi 30 Hari']:,.0f} per 30 hari ({row['Laju']:.0f}% dari budget).")
+    else:
+        st.info("Setel budget terlebih dahulu di sidebar untuk melihat analisis budgeting.")
+    
+    st.divider()
+    render_projection(df)
+
+def render_projection(df):
+    """Proyeksi saldo 12 bulan (Monte Carlo) dan peluang mencapai target tabungan."""
+    st.subheader("🎯 Proyeksi Tabungan")
+    st.caption(f"{projection.N_PATHS:,} simulasi arus kas {projection.HORIZON_MONTHS} bulan ke depan, "
+               "diambil acak dari bulan-bulan lengkap di riwayat, mulai dari saldo akhir saat ini.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        target = st.number_input("Target Saldo (Rp)", min_value=0.0, value=100_000_000.0,
+                                 step=1_000_000.0, key="savings_target")
+    with col2:
+        target_month = st.slider("Dalam (bulan)", min_value=1, max_value=projection.HORIZON_MONTHS,
+                                 value=projection.HORIZON_MONTHS, key="savings_target_month")
+    
+    # Simulasi dibagi antar sesi per revisi data & parameter target
+    as_of = pd.Timestamp(datetime.now().date())
+    result = cached_per_revision(
+        'savings_projection', projection.project, df, target, target_month, None, as_of,
+        params=(target, target_month, as_of.to_period('M'))
+    )
+    if result is None:
+        st.info(f"Butuh minimal {projection.MIN_HISTORY_MONTHS} bulan lengkap riwayat transaksi untuk proyeksi.")
+        return
+    
+    bands = result['bands']
+    target_row = bands.iloc[target_month - 1]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(f"Peluang Capai Target ({target_row['Bulan']:%b %Y})", f"{result['probability']:.0%}")
+    with col2:
+        st.metric("Median Saldo", f"Rp {target_row['P50']:,.0f}",
+                  f"Rp {target_row['P50'] - result['start_balance']:,.0f}")
+    with col3:
+        st.metric("Rentang P5 – P95", f"Rp {target_row['P5']:,.0f} – {target_row['P95']:,.0f}")
+    
+    st.altair_chart(charts.create_projection_chart(bands, target), use_container_width=True)
+    st.caption(f"Berdasarkan {result['history_months']} bulan riwayat; rata-rata net flow "
+               f"Rp {result['monthly_mean']:,.0f}/bulan. Pita gelap: P25–P75, pita terang: P5–P95.")
+
+def render_data(df, df_live, comparison, start_date, end_date, selected_kategori, flagged_transactions):
+    """Tab Data: detail transaksi berhalaman dari bulan berjalan atau arsip."""
+    st.subheader("Data Transaksi Lengkap")
+    
+    # Detail bulan tertutup hanya dibuka dari arsip saat dipilih
+    manifest = read_rollup_manifest()
+    archived_months = [
+        month for month in sorted(manifest["months"], reverse=True)
+        if start_date.strftime('%Y-%m') <= month <= end_date.strftime('%Y-%m')
+    ]
+    detail_source = st.selectbox(
+        "Sumber data",
+        ["Bulan berjalan"] + archived_months,
+        key="detail_source",
+        help="Bulan yang sudah ditutup disimpan sebagai arsip dan baru dibuka saat dipilih."
+    )
+    
+    if detail_source == "Bulan berjalan":
+        df_detail = df_live
+    else:
+        # Arsip yang dibuka milik sesi ini (LRU, dibatasi anggaran memori sesi)
+        # Disimpan bersama versi file: bulan yang ditulis ulang (mis. kategori dinilai ulang) dibaca lagi
+        archive_cache = st.session_state.setdefault('archive_cache', {})
+        version = manifest["months"][detail_source]
+        cached_version, df_detail = archive_cache.pop(detail_source, (None, None))
+        if df_detail is None or cached_version != version:
+            df_detail = load_archived_month(detail_source, manifest)
+        archive_cache[detail_source] = (version, df_detail)
+        # Bulan yang baru dibuka ikut dihitung; yang paling lama tidak dibuka dibuang dulu
+        enforce_session_memory_budget()
+    
+    # Search dan filter tambahan
+    col_search, col_sort = st.columns([2, 1])
+    with col_search:
+        search_query = st.text_input("🔍 Cari di Catatan...", placeholder="Ketik untuk mencari...", key="search_input")
+    
+    with col_sort:
+        sort_by = st.selectbox("Urutkan berdasarkan", list(SORT_OPTIONS), key="sort_select")
+    
+    only_anomalies = st.checkbox("🚨 Hanya transaksi anomali", key="only_anomalies",
+                                 disabled=detail_source != "Bulan berjalan")
+    
+    # Filter sebagai mask posisi; tidak ada salinan frame
+    tanggal_detail = df_detail['Tanggal']
+    mask = (
+        (tanggal_detail >= pd.Timestamp(start_date)) &
+        (tanggal_detail < pd.Timestamp(end_date) + timedelta(days=1)) &
+        df_detail['Kategori'].isin(selected_kategori)
+    )
+    if search_query:
+        mask &= df_detail['Catatan'].astype(str).str.contains(search_query, case=False, na=False, regex=False)
+    
+    # Tandai transaksi anomali (index = nomor baris sheet, hanya untuk data live)
+    is_live = detail_source == "Bulan berjalan"
+    is_anomaly = df_detail.index.isin(flagged_transactions.index) if is_live else np.zeros(len(df_detail), dtype=bool)
+    if only_anomalies and is_live:
+        mask &= is_anomaly
+    mask = mask.to_numpy()
+    
+    # Urutan sudah dihitung per revisi data; cukup saring lalu iris per halaman
+    sort_orders = cached_per_revision('detail_sort_orders', build_sort_orders, df_detail, params=(detail_source,))
+    order = sort_orders[sort_by]
+    visible_positions = order[mask[order]]
+    total_rows = len(visible_positions)
+    
+    # Tampilkan ringkasan
+    with st.expander("📊 Ringkasan Kategori", expanded=False):
+        # Baris kategori memakai hasil perbandingan periode yang sudah dihitung
+        df_summary = comparison[comparison['Transaksi'] > 0]
+        df_summary = df_summary.assign(**{
+            'vs Periode Lalu': percent_change(df_summary['Jumlah'], df_summary['Jumlah Sebelumnya']),
+            'vs Tahun Lalu': percent_change(df_summary['Jumlah'], df_summary['Jumlah Tahun Lalu']),
+        })[['Jumlah', 'Transaksi', 'vs Periode Lalu', 'vs Tahun Lalu']].reset_index()
+        df_summary = df_summary.rename(columns={'Jumlah': 'Total', 'Transaksi': 'Jumlah Transaksi'})
+        
+        st.dataframe(
+            df_summary,
+            column_config={
+                "Total": st.column_config.NumberColumn("Total (Rp)", format="Rp %'.0f"),
+                "Jumlah Transaksi": "Jumlah Transaksi",
+                "vs Periode Lalu": st.column_config.NumberColumn("Δ Periode Lalu", format="%+.1f%%"),
+                "vs Tahun Lalu": st.column_config.NumberColumn("Δ Tahun Lalu", format="%+.1f%%"),
+                "Tipe": "Tipe",
+                "Kategori": "Kategori"
+            },
+            use_container_width=True
+        )
+    
+    # Paginasi server-side: hanya halaman yang terlihat dikirim ke browser
+    col_size, col_first, col_prev, col_page, col_next, col_last = st.columns([2, 1, 1, 2, 1, 1])
+    with col_size:
+        page_size = st.selectbox("Baris per halaman", [25, 50, 100, 250], index=1, key="data_page_size")
+    n_pages = max(1, -(-total_rows // page_size))
+    
+    # Tombol lompat diproses sebelum widget halaman dibuat
+    current_page = min(max(st.session_state.get('data_page', 1), 1), n_pages)
+    with col_first:
+        if st.button("⏮", use_container_width=True, key="page_first"):
+            current_page = 1
+    with col_prev:
+        if st.button("◀", use_container_width=True, key="page_prev"):
+            current_page = max(current_page - 1, 1)
+    with col_next:
+        if st.button("▶", use_container_width=True, key="page_next"):
+            current_page = min(current_page + 1, n_pages)
+    with col_last:
+        if st.button("⏭", use_container_width=True, key="page_last"):
+            current_page = n_pages
+    st.session_state.data_page = current_page
+    with col_page:
+        page = st.number_input(f"Halaman (dari {n_pages:,})", min_value=1, max_value=n_pages,
+                               step=1, key="data_page")
+    
+    page_positions = visible_positions[(page - 1) * page_size:page * page_size]
+    df_page = df_detail.iloc[page_positions]
+    if is_live:
+        df_page = df_page.assign(Anomali=is_anomaly[page_positions])
+    
+    first_row = (page - 1) * page_size + 1 if total_rows else 0
+    st.caption(f"Menampilkan {first_row:,}–{(page - 1) * page_size + len(df_page):,} dari {total_rows:,} transaksi")
+    
+    # Tampilkan data transaksi
+    st.dataframe(
+        df_page,
+        column_config={
+            "Tanggal": st.column_config.DateColumn("Tanggal", format="DD/MM/YYYY"),
+            "Tipe": st.column_config.TextColumn("Tipe"),
+            "Kategori": st.column_config.TextColumn("Kategori"),
+            "Jumlah": st.column_config.NumberColumn("Jumlah (Rp)", format="Rp %'.0f"),
+            "Catatan": st.column_config.TextColumn("Catatan"),
+            "Mata Uang": st.column_config.TextColumn("Mata Uang"),
+            "Jumlah Asli": st.column_config.NumberColumn("Jumlah Asli", format="%'.2f"),
+            "Anomali": st.column_config.CheckboxColumn("🚨 Anomali")
+        },
+        use_container_width=True,
+        height=400,
+        hide_index=True
+    )
+    
+    # CSV data yang difilter hanya dibuat saat diminta
+    if st.button("📥 Download Data (CSV)", use_container_width=True, key="prepare_filtered_csv"):
+        csv = df_detail.iloc[visible_positions].to_csv(index=False)
+        st.download_button(
+            label="Download CSV",
+            data=csv,
+            file_name=f"data_filtered_{start_date}_{end_date}.csv",
+            mime="text/csv",
+            use_container_width=True,
+            key="download_filtered"
+        )
+    
+    # Tampilkan statistik cache jika diminta
+    if st.session_state.get('show_stats', False):
+        with st.expander("📈 Cache Statistics"):
+            st.write(f"**Last Refresh:** {st.session_state.get('last_refresh', 'Never')}")
+            st.write(f"**Cache Key:** {st.session_state.get('cache_key', 'None')}")
+            st.write(f"**Data Revision:** {st.session_state.get('data_revision', 0)}")
+            st.write(f"**Data Rows (live):** {len(df_live)}")
+            st.write(f"**Daily Rollup Rows:** {len(df)}")
+            st.write(f"**Archived Months:** {len(read_rollup_manifest()['months'])}")
+            st.write(f"**Category Rules:** {len(load_category_rules())}")
+            st.write(f"**Shared Memory (semua sesi):** {shared_memory_bytes() / 1024 / 1024:.2f} MB")
+            st.write(f"**Session Memory:** {session_memory_bytes() / 1024 / 1024:.2f} MB "
+                     f"/ {SESSION_MEMORY_BUDGET_MB:.0f} MB")
+
+def render_dashboard(worksheet):
+    """Filter, metrik dan tab utama di atas snapshot ledger bersama."""
+    # Load data dengan caching yang aman.
+    # df_live: detail transaksi bulan berjalan; df: total harian seluruh riwayat,
+    # keduanya dari revisi yang sama meski sesi lain sedang me-refresh
+    snapshot = load_data_with_cache(worksheet)
+    df_live, df = snapshot.live, snapshot.daily
+    
+    if df.empty:
+        st.info("📭 Belum ada transaksi di Google Sheet. Mulai dengan menambahkan transaksi di sidebar!")
+        st.balloons()
+        return
+    
+    # --- 1. FILTER DATA ---
+    start_date, end_date, selected_kategori, all_kategori = render_filters(df)
+    
+    # --- 2. LOGIKA FILTERISASI DATA ---
+    df_filtered = filter_daily(df, start_date, end_date, selected_kategori, all_kategori)
+    if df_filtered.empty:
+        st.warning("⚠️ Tidak ada data yang sesuai dengan filter Anda.")
+        return
+    
+    # --- 3. HEADER METRICS ---
+    # Total rentang terpilih, periode sebelumnya & tahun lalu dari prefix sum per revisi
+    period_totals = cached_per_revision('period_totals', build_period_totals, df)
+    comparison = compare_periods(period_totals, start_date, end_date)
+    if len(selected_kategori) < len(all_kategori):
+        comparison = comparison[comparison.index.get_level_values('Kategori').isin(selected_kategori)]
+    render_metrics(df, comparison, start_date, end_date)
+    st.divider()
+    
+    # Anomali dihitung untuk seluruh ledger, ditampilkan di Ringkasan & Data
+    flagged_days, flagged_transactions = detect_anomalies_with_cache(df, df_live)
+    # Jumlah bergulir 7/30/90 hari untuk Cash Flow Harian & burn rate budget
+    rolling_state = rolling_with_cache(snapshot)
+    
+    # --- 4. TABS UTAMA ---
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "📊 Ringkasan", 
+        "📈 Analisis", 
+        "📅 Kalender", 
+        "💰 Budgeting", 
+        "📋 Data"
+    ])
+    
+    with tab1:
+        render_ringkasan(df, df_filtered, start_date, end_date, selected_kategori,
+                         flagged_days, flagged_transactions, rolling_state)
+    with tab2:
+        render_analisis(df_filtered)
+    with tab3:
+        render_kalender(df)
+    with tab4:
+        render_budgeting(df, df_filtered, rolling_state, end_date)
+    with tab5:
+        render_data(df, df_live, comparison, start_date, end_date, selected_kategori,
+                    flagged_transactions)
+
+def render_setup_help():
+    """Petunjuk konfigurasi saat koneksi Google Sheets gagal."""
+    st.error("❌ Aplikasi tidak dapat berjalan tanpa koneksi ke Google Sheets.")
+    st.info("""
+    ### Untuk menjalankan aplikasi:
+    1. Buat file `secrets.toml` di folder `.streamlit/`
+    2. Isi dengan credentials Google Sheets Anda:
+    ```
+    [gsheets_credentials]
+    type = "service_account"
+    project_id = "..."
+    private_key_id = "..."
+    private_key = "..."
+    client_email = "..."
+    client_id = "..."
+    auth_uri = "https://accounts.google.com/o/oauth2/auth"
+    token_uri = "https://oauth2.googleapis.com/token"
+    auth_provider_x509_cert_url = "https://www.googleapis.com/oauth2/v1/certs"
+    client_x509_cert_url = "..."
+    
+    GSHEET_URL = "https://docs.google.com/spreadsheets/d/..."
+    WORKSHEET_NAME = "Data"
+    ```
+    3. Restart aplikasi Streamlit
+    """)
+
+def main():
+    """Entry point halaman; dipanggil dari ``app.py`` setelah ``st.set_page_config``."""
+    render_header()
+    worksheet = connect()
+    
+    if API_PORT:
+        start_summary_api(API_HOST, int(API_PORT))
+    
+    form = render_sidebar(worksheet)
+    if form["submitted"]:
+        save_transaction(worksheet, form)
+    
+    if worksheet is not None:
+        render_dashboard(worksheet)
+    else:
+        render_setup_help()
+    
+    # --- Footer ---
+    st.divider()
+    st.caption("© 2026 FinanceKita PRO | Made with ❤️ using Streamlit")